@@ -0,0 +1,72 @@
+"""
+Shared helpers for the benchmark scripts.
+
+The benchmarks never talk to python.org: they serve a synthetic copy of the
+downloads page in ``benchmarks/data`` (the page's markup, with generated
+releases and dates) from a local HTTP stand-in and point ``PyVersionTracker``
+at it.
+"""
+import sys
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+
+BENCH_DIR = Path(__file__).resolve().parent
+DATA_DIR = BENCH_DIR / 'data'
+DOWNLOADS_PAGE = DATA_DIR / 'downloads.html'
+
+sys.path.insert(0, str(BENCH_DIR.parent / 'src'))
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+class _StandInServer(ThreadingHTTPServer):
+    # The default backlog of 5 stalls concurrent clients on SYN retransmits.
+    request_queue_size = 128
+    daemon_threads = True
+
+
+@contextmanager
+def serve_fixture():
+    """Serve ``benchmarks/data`` on an ephemeral localhost port and yield the downloads page URL."""
+    server = _StandInServer(('127.0.0.1', 0),
+                                partial(_QuietHandler, directory=str(DATA_DIR)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f'http://127.0.0.1:{server.server_port}/{DOWNLOADS_PAGE.name}'
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@contextmanager
+def tracker_on_fixture():
+    """Yield ``PyVersionTracker`` pointed at the local stand-in, with its caches cleared."""
+    from py_version_tracker import PyVersionTracker
+    
+    with serve_fixture() as url:
+        previous, PyVersionTracker._MAIN_PG = PyVersionTracker._MAIN_PG, url
+        reset_caches()
+        try:
+            yield PyVersionTracker
+        finally:
+            PyVersionTracker._MAIN_PG = previous
+
+
+def reset_caches() -> None:
+    """Drop every in-process cache so the next query starts cold (disk snapshots are untouched)."""
+    from py_version_tracker import PyVersionTracker
+    
+    PyVersionTracker._SHARED = None
+    PyVersionTracker._INDEXES.clear()
+    PyVersionTracker._DETAILS.clear()
+    PyVersionTracker._STATS.clear()
+    PyVersionTracker._soup_cache.cache_clear()
+    PyVersionTracker._snapshot_cache.cache_clear()
@@ -0,0 +1,147 @@
+"""
+Multi-threaded stress benchmark for the shared tracker.
+
+Releases many threads at once against a cold ``PyVersionTracker.shared()``
+(served by a local HTTP stand-in) and checks, with the instrumentation
+counters, that the downloads page was fetched and parsed exactly once. It
+then hammers the warm tracker with queries while another thread keeps
+reloading the index, and reports queries per second and any errors.
+
+Exits with status 1 if any check fails.
+
+Usage:
+    python benchmarks/bench_concurrency.py [--threads N] [--queries N]
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+
+from _harness import reset_caches, tracker_on_fixture
+
+
+def _hammer(threads: int, work) -> list:
+    """Run 'work(thread_number)' on many threads released together; return the errors raised."""
+    barrier = threading.Barrier(threads)
+    errors = []
+
+    def _run(number):
+        barrier.wait()
+        try:
+            work(number)
+        except BaseException as error:  # PyVersionException is a BaseException
+            errors.append(repr(error))
+
+    workers = [threading.Thread(target=_run, args=(n,)) for n in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return errors
+
+
+def cold_start(tracker, threads: int) -> dict:
+    from py_version_tracker import TrackerStats
+
+    reset_caches()
+    trackers = [None] * threads
+
+    def _first_request(number):
+        shared = trackers[number] = tracker.shared()
+        shared.max_stable_version, tracker.is_deprecated('3.8.1')
+
+    with TrackerStats() as stats:
+        errors = _hammer(threads, _first_request)
+    timings = stats.timings
+    return {'threads': threads,
+            'http_requests': stats.counters.get('http.requests', 0),
+            'parses': timings.get('parse', {}).get('count', 0),
+            'distinct_trackers': len({id(t) for t in trackers if t is not None}),
+            'errors': errors}
+
+
+def cold_soup(tracker, threads: int) -> dict:
+    from py_version_tracker import TrackerStats
+
+    reset_caches()
+    soups = [None] * threads
+
+    def _first_request(number):
+        soups[number] = tracker._soupify(tracker._MAIN_PG)
+
+    with TrackerStats() as stats:
+        errors = _hammer(threads, _first_request)
+    return {'threads': threads,
+            'http_requests': stats.counters.get('http.requests', 0),
+            'soups_built': stats.timings.get('soup', {}).get('count', 0),
+            'distinct_soups': len({id(s) for s in soups if s is not None}),
+            'errors': errors}
+
+
+def warm_queries(tracker, threads: int, queries: int, seed: int) -> dict:
+    shared = tracker.shared()
+    releases = [record.version for record in shared.all_versions]
+    stop = threading.Event()
+    reloads = [0]
+
+    def _reloader():
+        while not stop.is_set():
+            shared.reload()
+            reloads[0] += 1
+
+    def _reader(number):
+        rng = random.Random(seed + number)
+        for _ in range(queries):
+            version = rng.choice(releases)
+            tracker.is_deprecated(version)
+            shared.version_range(version, above=True)
+            shared.max_stable_version
+
+    reloader = threading.Thread(target=_reloader, daemon=True)
+    reloader.start()
+    start = time.perf_counter()
+    try:
+        errors = _hammer(threads, _reader)
+    finally:
+        elapsed = time.perf_counter() - start
+        stop.set()
+        reloader.join()
+    total = threads * queries * 3
+    return {'threads': threads, 'queries': total, 'seconds': round(elapsed, 4),
+            'per_second': round(total / elapsed), 'reloads': reloads[0], 'errors': errors}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=64)
+    parser.add_argument('--queries', type=int, default=500, help='Query rounds per thread in the warm phase.')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    # Every cold load must fetch and parse the page, not read a disk snapshot.
+    os.environ['PY_VERSION_TRACKER_CACHE_DIR'] = 'off'
+    with tracker_on_fixture() as tracker:
+        result = {'benchmark': 'concurrency',
+                'cold_start': cold_start(tracker, args.threads),
+                'cold_soup': cold_soup(tracker, args.threads),
+                'warm': warm_queries(tracker, args.threads, args.queries, args.seed)}
+
+    cold, soup = result['cold_start'], result['cold_soup']
+    failures = [name for name, ok in (
+        ('one fetch on cold start', cold['http_requests'] == 1),
+        ('one parse on cold start', cold['parses'] == 1),
+        ('one shared tracker', cold['distinct_trackers'] == 1),
+        ('one fetch for concurrent _soupify', soup['http_requests'] == 1),
+        ('one soup for concurrent _soupify', soup['soups_built'] == 1 == soup['distinct_soups']),
+        ('no errors', not (cold['errors'] or soup['errors'] or result['warm']['errors'])),
+        ) if not ok]
+    result['failures'] = failures
+    print(json.dumps(result))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+Import-time benchmark for py_version_tracker.
+
+Each sample imports the package in a fresh interpreter with every outbound
+socket operation disabled, so any network access during import fails loudly
+instead of hanging until a timeout.
+
+Usage:
+    python benchmarks/bench_import.py [--runs N] [--budget-ms MS]
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+
+_PROBE = '''
+import socket, time
+def _no_network(*args, **kwargs):
+    raise OSError('network access is disabled during the import benchmark')
+socket.socket.connect = socket.socket.connect_ex = _no_network
+socket.getaddrinfo = socket.create_connection = _no_network
+start = time.perf_counter()
+import py_version_tracker
+print((time.perf_counter() - start) * 1000)
+'''
+
+
+def _sample() -> float:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (str(SRC_DIR), os.environ.get('PYTHONPATH')))))
+    # Measure imports the way installed packages see them: from cached bytecode.
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    proc = subprocess.run([sys.executable, '-c', _PROBE], env=env,
+                        capture_output=True, text=True)
+    if proc.returncode:
+        raise SystemExit(f'Importing py_version_tracker failed:\n{proc.stderr}')
+    return float(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--budget-ms', type=float, default=50.0,
+                        help='Fail if the median import time exceeds this budget.')
+    args = parser.parse_args(argv)
+    
+    _sample()  # warm-up run writes the bytecode cache
+    samples = [_sample() for _ in range(args.runs)]
+    result = {'benchmark': 'import', 'runs': args.runs,
+            'median_ms': round(statistics.median(samples), 3),
+            'min_ms': round(min(samples), 3),
+            'max_ms': round(max(samples), 3),
+            'budget_ms': args.budget_ms}
+    print(json.dumps(result))
+    return int(result['median_ms'] > args.budget_ms)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+Throughput benchmark for ``is_version`` / ``is_deprecated`` lookups.
+
+Validates a synthetic fleet inventory of interpreter strings against the
+synthetic downloads page and reports queries per second.
+
+Usage:
+    python benchmarks/bench_lookups.py [--queries N]
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+from _harness import tracker_on_fixture
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--queries', type=int, default=50_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    
+    # The stand-in listens on a new port every run; do not leave a disk snapshot for each one.
+    os.environ['PY_VERSION_TRACKER_CACHE_DIR'] = 'off'
+    with tracker_on_fixture() as tracker:
+        releases = [record.version for record in tracker().all_versions]
+        rng = random.Random(args.seed)
+        inventory = [rng.choice(releases) for _ in range(args.queries)]
+        
+        results = {}
+        for name, query in (('is_version', tracker.is_version),
+                            ('is_deprecated', tracker.is_deprecated)):
+            start = time.perf_counter()
+            for version in inventory:
+                query(version)
+            elapsed = time.perf_counter() - start
+            results[name] = {'queries': args.queries,
+                            'seconds': round(elapsed, 4),
+                            'queries_per_second': round(args.queries / elapsed)}
+    
+    print(json.dumps({'benchmark': 'lookups', 'releases': len(releases), 'results': results}))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Parser backend benchmark for the downloads page.
+
+Builds the release index from the synthetic page with every available parser
+backend, checks each result against '_clean_page' on a full html.parser tree,
+and reports median parse time and peak Python memory (tracemalloc; memory
+allocated inside lxml's C library is not counted).
+
+Usage:
+    python benchmarks/bench_parsers.py [--runs N] [--page PATH]
+"""
+import sys
+import json
+import time
+import argparse
+import statistics
+import tracemalloc
+
+from _harness import DOWNLOADS_PAGE
+
+
+def _reference(html: str):
+    from bs4 import BeautifulSoup
+    from py_version_tracker import PyVersionTracker
+    from py_version_tracker.parsers import INDEX_COLUMNS, LINK_COLUMN
+    
+    soup = BeautifulSoup(html, 'html.parser')
+    columns = {k: [i.get_text(strip=True) for i in PyVersionTracker._parse_py(soup, name='span', class_=k)]
+                for k in INDEX_COLUMNS}
+    columns[LINK_COLUMN] = [(i.find('a', href=True) or {}).get('href', '')
+                            for i in PyVersionTracker._parse_py(soup, name='span', class_='release-number')]
+    buttons = [i.get_text(strip=True) for i in PyVersionTracker._parse_py(soup, name='p',
+                                                                        class_='download-buttons',
+                                                                        attr='find')]
+    return columns, buttons[1].split()[-1]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--page', default=str(DOWNLOADS_PAGE))
+    args = parser.parse_args(argv)
+    
+    from py_version_tracker.parsers import available_backends, extract_columns
+    
+    with open(args.page, encoding='utf-8') as page:
+        html = page.read()
+    reference = _reference(html)
+    
+    results = {}
+    for backend in available_backends():
+        extract_columns(html, backend)  # warm up imports
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            extract_columns(html, backend)
+            timings.append(time.perf_counter() - start)
+        tracemalloc.start()
+        output = extract_columns(html, backend)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results[backend] = {'median_ms': round(statistics.median(timings) * 1000, 3),
+                            'peak_kib': round(peak / 1024, 1),
+                            'identical': output == reference}
+    
+    print(json.dumps({'benchmark': 'parsers', 'page_bytes': len(html.encode()),
+                    'runs': args.runs, 'results': results}))
+    return int(not all(r['identical'] for r in results.values()))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""
+Hot-path benchmark for PyVersionTracker.
+
+Runs against the synthetic downloads page served by a local HTTP stand-in and
+reports, as one JSON document:
+
+- cold_start: fresh interpreters importing the package and answering a first
+  query, fetching the page (no cache), from a warm disk cache, and from an
+  offline snapshot (wall time and peak RSS).
+- warm: first in-process load versus repeated loads of the release index.
+- latency: per-call median/p95/p99 of single queries ('is_version',
+  'is_deprecated', 'version_range', 'supported_on', '_soupify', ...).
+- throughput: bulk queries per second ('is_version', 'classify_versions',
+  'version_checker_many').
+- memory: tracemalloc peak of building the release index, and of the
+  'BeautifulSoup' tree '_soupify' keeps.
+
+Usage:
+    python benchmarks/bench_tracker.py [--quick] [--samples N] [--bulk N]
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+
+from _harness import BENCH_DIR, reset_caches, tracker_on_fixture
+
+
+_COLD_PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+from py_version_tracker import PyVersionTracker
+imported = time.perf_counter()
+PyVersionTracker._MAIN_PG = sys.argv[1]
+tracker = PyVersionTracker()
+tracker.all_versions, tracker.max_stable_version, PyVersionTracker.is_deprecated('3.8.1')
+done = time.perf_counter()
+try:
+    import resource
+    maxrss_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    maxrss_kib = maxrss_kib // 1024 if sys.platform == 'darwin' else maxrss_kib
+except ImportError:
+    maxrss_kib = None
+print(json.dumps({'import_ms': (imported - start) * 1000, 'first_query_ms': (done - imported) * 1000,
+                'maxrss_kib': maxrss_kib}))
+'''
+
+
+def _cold_sample(url: str, env: dict) -> dict:
+    proc = subprocess.run([sys.executable, '-c', _COLD_PROBE, url], env=env, capture_output=True, text=True)
+    if proc.returncode:
+        raise SystemExit(f'Cold start probe failed:\n{proc.stderr}')
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _summarize_cold(samples) -> dict:
+    return {'runs': len(samples),
+            'import_ms': round(statistics.median(s['import_ms'] for s in samples), 3),
+            'first_query_ms': round(statistics.median(s['first_query_ms'] for s in samples), 3),
+            'maxrss_kib': max((s['maxrss_kib'] or 0) for s in samples) or None}
+
+
+def cold_start(url: str, runs: int) -> dict:
+    base = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (str(BENCH_DIR.parent / 'src'),
+                                                                    os.environ.get('PYTHONPATH')))))
+    base.pop('PYTHONDONTWRITEBYTECODE', None)
+    base.pop('PY_VERSION_TRACKER_OFFLINE', None)
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='pvt-bench-') as tmp:
+        network = dict(base, PY_VERSION_TRACKER_CACHE_DIR='off')
+        _cold_sample(url, network)  # warm-up run writes the bytecode cache
+        results['network'] = _summarize_cold([_cold_sample(url, network) for _ in range(runs)])
+
+        disk = dict(base, PY_VERSION_TRACKER_CACHE_DIR=os.path.join(tmp, 'cache'))
+        _cold_sample(url, disk)  # populates the snapshot cache
+        results['disk_cache'] = _summarize_cold([_cold_sample(url, disk) for _ in range(runs)])
+
+        from py_version_tracker import PyVersionTracker
+
+        snapshot = PyVersionTracker.refresh_snapshot(os.path.join(tmp, 'releases.json'), url=url)
+        offline = dict(base, PY_VERSION_TRACKER_OFFLINE='1', PY_VERSION_TRACKER_SNAPSHOT=str(snapshot))
+        results['offline_snapshot'] = _summarize_cold([_cold_sample(url, offline) for _ in range(runs)])
+    return results
+
+
+def _percentiles(samples_ns) -> dict:
+    ordered = sorted(samples_ns)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] / 1000
+    return {'median_us': round(statistics.median(ordered) / 1000, 3),
+            'p95_us': round(pick(0.95), 3),
+            'p99_us': round(pick(0.99), 3)}
+
+
+def _latency(func, samples: int) -> dict:
+    func()
+    timings = []
+    clock = time.perf_counter_ns
+    for _ in range(samples):
+        start = clock()
+        func()
+        timings.append(clock() - start)
+    return _percentiles(timings)
+
+
+def warm(tracker, samples: int) -> dict:
+    reset_caches()
+    start = time.perf_counter()
+    tracker()._release_index()
+    first_ms = (time.perf_counter() - start) * 1000
+    return {'first_load_ms': round(first_ms, 3),
+            'repeat_load': _latency(lambda: tracker()._release_index(), samples)}
+
+
+def latency(tracker, samples: int) -> dict:
+    url = tracker._MAIN_PG
+    tracker._soupify(url)
+    queries = {
+        'is_version': lambda: tracker.is_version('3.8.1'),
+        'is_deprecated': lambda: tracker.is_deprecated('3.7.2'),
+        'max_stable_version': lambda: tracker().max_stable_version,
+        'all_versions': lambda: list(tracker().all_versions),
+        '_get_all_versions': lambda: tracker()._get_all_versions(),
+        'version_range_one_sided': lambda: tracker.version_range('3.9', above=True),
+        'version_range_bounded': lambda: tracker.version_range('3.8', '3.11.2'),
+        'release_series': lambda: tracker.release_series('3.10'),
+        'supported_on': lambda: tracker.supported_on('2024-06-01'),
+        'eol_within': lambda: tracker.eol_within(90, today='2024-08-01'),
+        'first_release_after': lambda: tracker.first_release_after('2019-01-01'),
+        '_soupify_cached': lambda: tracker._soupify(url),
+        }
+    return {name: _latency(query, samples) for name, query in queries.items()}
+
+
+def _rate(func, count: int) -> dict:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    return {'items': count, 'seconds': round(elapsed, 4), 'per_second': round(count / elapsed)}
+
+
+def throughput(tracker, count: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    releases = [record.version for record in tracker().all_versions]
+    versions = [rng.choice(releases) for _ in range(count)]
+    interpreters = [f'{version} (main, Jun  7 2023, 12:45:35) [GCC 12.2.0]' for version in versions]
+    return {
+        'is_version': _rate(lambda: [tracker.is_version(v) for v in versions], count),
+        'is_deprecated': _rate(lambda: [tracker.is_deprecated(v) for v in versions], count),
+        'classify_versions': _rate(lambda: list(tracker.classify_versions(versions)), count),
+        'version_checker_many': _rate(lambda: list(tracker.version_checker_many(interpreters, processes=1)), count),
+        }
+
+
+def memory(tracker) -> dict:
+    reset_caches()
+    tracemalloc.start()
+    tracker()._release_index()
+    index_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+    tracker._soupify(tracker._MAIN_PG)
+    soup_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'index_build_peak_kib': round(index_peak / 1024, 1),
+            'soupify_peak_kib': round(soup_peak / 1024, 1)}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--quick', action='store_true', help='Fewer runs, for smoke testing.')
+    parser.add_argument('--cold-runs', type=int, default=None)
+    parser.add_argument('--samples', type=int, default=None, help='Samples per latency measurement.')
+    parser.add_argument('--bulk', type=int, default=None, help='Items per throughput measurement.')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    cold_runs = args.cold_runs or (2 if args.quick else 7)
+    samples = args.samples or (200 if args.quick else 5_000)
+    bulk = args.bulk or (5_000 if args.quick else 100_000)
+
+    # In-process measurements read the page over the stand-in, not from disk snapshots.
+    os.environ['PY_VERSION_TRACKER_CACHE_DIR'] = 'off'
+    with tracker_on_fixture() as tracker:
+        url = tracker._MAIN_PG
+        result = {'benchmark': 'tracker',
+                'cold_start': cold_start(url, cold_runs),
+                'warm': warm(tracker, samples),
+                'latency': latency(tracker, samples),
+                'throughput': throughput(tracker, bulk, args.seed),
+                'memory': memory(tracker)}
+    print(json.dumps(result))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
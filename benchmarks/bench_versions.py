@@ -0,0 +1,81 @@
+"""
+Throughput benchmark for bulk version parsing and comparison.
+
+Normalizes a synthetic inventory of ``sys.version`` strings and requirement
+specifiers and reports versions per second for the per-string path that
+``version_checker`` uses, ``parse_versions`` (cold and warm LRU cache),
+``satisfies_minimum`` and ``compare_many`` (pure Python, plus NumPy when
+installed).
+
+Usage:
+    python benchmarks/bench_versions.py [--versions N] [--distinct N]
+"""
+import sys
+import json
+import time
+import random
+import argparse
+from platform import _sys_version
+
+import _harness  # noqa: F401  (puts 'src' on sys.path)
+
+
+def _inventory(count: int, distinct: int, seed: int):
+    rng = random.Random(seed)
+    pool = []
+    for _ in range(distinct):
+        major, minor, micro = 3, rng.randint(6, 13), rng.randint(0, 20)
+        pool.append(rng.choice((
+            f'{major}.{minor}.{micro} (main, Jun  7 2023, 12:45:35) [GCC {rng.randint(7, 13)}.{rng.randint(0, 3)}.0]',
+            f'{major}.{minor}.{micro} | packaged by conda-forge | (main, Feb  2 2024, 21:18:40) [Clang 16.0.6 ]',
+            f'>={major}.{minor}',
+            f'~={major}.{minor}.{micro}',
+            f'Python {major}.{minor}.{micro}',
+            )))
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def _rate(func, count: int) -> dict:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    return {'seconds': round(elapsed, 4), 'versions_per_second': round(count / elapsed)}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--versions', type=int, default=500_000)
+    parser.add_argument('--distinct', type=int, default=5_000)
+    parser.add_argument('--minimum', default='3.9')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    from py_version_tracker import PyVersionTracker
+    from py_version_tracker.versions import _numpy, _parse_text
+
+    inventory = _inventory(args.versions, args.distinct, args.seed)
+    # The subset 'platform._sys_version' (used by 'version_checker') can parse.
+    interpreters = [v for v in inventory if v[0].isdigit() and '[GCC' in v]
+    minimum = args.minimum
+
+    results = {}
+    results['per_string'] = _rate(lambda: [PyVersionTracker.str2tuple(_sys_version(v)[1])
+                                            for v in interpreters], len(interpreters))
+    _parse_text.cache_clear()
+    results['parse_versions_cold'] = _rate(lambda: PyVersionTracker.parse_versions(inventory), len(inventory))
+    results['parse_versions_warm'] = _rate(lambda: PyVersionTracker.parse_versions(inventory), len(inventory))
+    backends = (False, True) if _numpy() is not None else (False,)
+    for use_numpy in backends:
+        suffix = '_numpy' if use_numpy else ''
+        results[f'satisfies_minimum{suffix}'] = _rate(
+            lambda: PyVersionTracker.satisfies_minimum(inventory, minimum, use_numpy=use_numpy), len(inventory))
+        results[f'compare_many{suffix}'] = _rate(
+            lambda: PyVersionTracker.compare_many(inventory, minimum, use_numpy=use_numpy), len(inventory))
+
+    print(json.dumps({'benchmark': 'versions', 'versions': len(inventory),
+                    'distinct': args.distinct, 'numpy': len(backends) > 1, 'results': results}))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Run every benchmark and collect the results into one JSON document.
+
+Each ``bench_*.py`` script runs in its own interpreter and prints one JSON
+line; the suite adds run metadata (commit, Python, platform, time) so results
+can be stored and compared across releases.
+
+Usage:
+    python benchmarks/run_suite.py [--quick] [--output results.json] [--compare baseline.json]
+"""
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+
+from _harness import BENCH_DIR
+
+
+# Extra arguments that keep each benchmark short under '--quick'.
+_QUICK_ARGS = {'bench_concurrency': ['--threads', '16', '--queries', '50'],
+                'bench_import': ['--runs', '3'],
+                'bench_lookups': ['--queries', '5000'],
+                'bench_parsers': ['--runs', '3'],
+                'bench_tracker': ['--quick'],
+                'bench_versions': ['--versions', '50000']}
+
+
+def _commit() -> str:
+    proc = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR,
+                        capture_output=True, text=True)
+    return proc.stdout.strip() or None
+
+
+def _flatten(__data, prefix: str=''):
+    if isinstance(__data, dict):
+        for key, value in __data.items():
+            yield from _flatten(value, f'{prefix}.{key}' if prefix else key)
+    elif isinstance(__data, (int, float)) and not isinstance(__data, bool):
+        yield prefix, __data
+
+
+def compare(__baseline: dict, __current: dict) -> list:
+    """Rows of (metric, baseline, current, ratio) for every numeric metric present in both runs."""
+    old = dict(_flatten(__baseline['results']))
+    return [(metric, old[metric], value, round(value / old[metric], 3) if old[metric] else None)
+            for metric, value in _flatten(__current['results']) if metric in old]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--quick', action='store_true', help='Shorter runs, for smoke testing.')
+    parser.add_argument('--only', nargs='*', default=None, help='Benchmark names to run (e.g. bench_tracker).')
+    parser.add_argument('--output', default=None, help='Write the results here instead of stdout.')
+    parser.add_argument('--compare', default=None, help='Previous results file to print ratios against.')
+    args = parser.parse_args(argv)
+    
+    from py_version_tracker.py_version_tracker import __version__
+    
+    scripts = sorted(BENCH_DIR.glob('bench_*.py'))
+    if args.only:
+        scripts = [s for s in scripts if s.stem in args.only]
+    report = {'meta': {'commit': _commit(), 'package_version': __version__,
+                        'python': platform.python_version(), 'implementation': platform.python_implementation(),
+                        'platform': platform.platform(), 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                        'quick': args.quick},
+            'results': {}}
+    failed = []
+    for script in scripts:
+        extra = _QUICK_ARGS.get(script.stem, []) if args.quick else []
+        proc = subprocess.run([sys.executable, str(script), *extra], cwd=BENCH_DIR, capture_output=True, text=True)
+        lines = proc.stdout.strip().splitlines()
+        try:
+            report['results'][script.stem] = json.loads(lines[-1])
+        except (IndexError, ValueError):
+            report['results'][script.stem] = {'error': proc.stderr.strip().splitlines()[-1:]}
+        if proc.returncode:
+            failed.append(script.stem)
+    report['meta']['failed'] = failed
+    
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as results:
+            results.write(output + '\n')
+    else:
+        print(output)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as baseline:
+            rows = compare(json.load(baseline), report)
+        for metric, old, new, ratio in rows:
+            print(f'{metric:<70} {old:>14} {new:>14} {ratio if ratio is not None else "-":>8}', file=sys.stderr)
+    return int(bool(failed))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
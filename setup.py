@@ -19,6 +19,7 @@ setup(
     license="Apache Software License",
     install_requires=['aiohttp~=3.9.0b0', 'beautifulsoup4~=4.12.2',
                     'setuptools~=68.2.2', 'pypistats~=1.5.0'],
+    extras_require={'lxml': ['lxml'], 'numpy': ['numpy']},
     classifiers=[
     "Programming Language :: Python :: 3",
     "License :: OSI Approved :: Apache Software License", 
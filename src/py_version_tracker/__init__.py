@@ -1 +1,7 @@
-from .py_version_tracker import *
\ No newline at end of file
+from .py_version_tracker import *
+from .parsers import *
+from .cache import *
+from .versions import *
+from .daemon import *
+from .export import *
+from .instrumentation import *
@@ -0,0 +1,110 @@
+import sys
+import json
+import argparse
+
+from .py_version_tracker import PyVersionTracker, PyVersionException
+
+
+def _read_inventory(__file, __format: str):
+    if __format == 'csv':
+        import csv
+        
+        yield from csv.DictReader(__file)
+    elif __format == 'jsonl':
+        yield from (json.loads(line) for line in __file if line.strip())
+    else:
+        yield from (line.strip() for line in __file if line.strip())
+
+
+def _check(args) -> int:
+    fmt = args.format or next((ext for ext in ('jsonl', 'csv') if args.inventory.endswith(f'.{ext}')), 'lines')
+    inventory = sys.stdin if args.inventory == '-' else open(args.inventory, encoding='utf-8', newline='')
+    try:
+        for verdict in PyVersionTracker.version_checker_many(_read_inventory(inventory, fmt),
+                                                            args.minimum, processes=args.processes):
+            print(json.dumps(verdict._asdict()))
+    finally:
+        if inventory is not sys.stdin:
+            inventory.close()
+    return 0
+
+
+def _serve(args) -> int:
+    from .daemon import ReleaseRefresher
+    
+    if args.snapshot is None and args.socket is None:
+        raise PyVersionException("Nothing to serve: pass '--snapshot' and/or '--socket'.")
+    refresher = ReleaseRefresher(interval=args.interval, jitter=args.jitter,
+                                snapshot=args.snapshot, socket_path=args.socket, url=args.url)
+    refresher.subscribe(lambda event: print(event, flush=True))
+    try:
+        refresher.run_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m py_version_tracker',
+                                    description='PyVersionTracker command line utilities.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    snapshot = commands.add_parser('snapshot',
+                                help='Fetch python.org and write the release snapshot used in offline mode.')
+    snapshot.add_argument('-o', '--output', default=None,
+                        help='Destination file (default is the user cache directory).')
+    snapshot.add_argument('--url', default='',
+                        help='Downloads page to snapshot (default is the official page).')
+    
+    export = commands.add_parser('export',
+                                help='Export the release index to JSON Lines, CSV or a memory-mappable binary file.')
+    export.add_argument('output', help="Destination file ('.jsonl', '.csv' or '.pvti').")
+    export.add_argument('--format', choices=('jsonl', 'csv', 'binary'), default=None,
+                        help='Export format (default is inferred from the file extension).')
+    export.add_argument('--url', default='',
+                        help='Downloads page to export (default is the official page).')
+    
+    check = commands.add_parser('check',
+                                help='Audit a CSV or JSONL inventory of sys.version strings and print JSONL verdicts.')
+    check.add_argument('inventory', nargs='?', default='-',
+                        help="Inventory file with 'host' and 'sys_version' columns/keys (default is stdin).")
+    check.add_argument('--format', choices=('jsonl', 'csv', 'lines'), default=None,
+                        help='Inventory format (default is inferred from the file extension, else one sys.version per line).')
+    check.add_argument('--minimum', default=None,
+                        help='Minimum required version (default is the minimum stable version).')
+    check.add_argument('--processes', type=int, default=None,
+                        help='Worker processes for large inventories (default is the number of CPUs).')
+    
+    serve = commands.add_parser('serve',
+                                help='Keep the release index fresh and share it over a snapshot file and/or a Unix socket.')
+    serve.add_argument('--snapshot', default=None,
+                        help='Shared snapshot file to keep up to date (usable with PY_VERSION_TRACKER_SNAPSHOT).')
+    serve.add_argument('--socket', default=None,
+                        help='Unix socket to serve the release index on.')
+    serve.add_argument('--interval', type=float, default=3600,
+                        help='Seconds between refreshes (default is 3600).')
+    serve.add_argument('--jitter', type=float, default=0.1,
+                        help='Fraction of random jitter applied to each delay (default is 0.1).')
+    serve.add_argument('--url', default='',
+                        help='Downloads page to track (default is the official page).')
+    
+    args = parser.parse_args(argv)
+    try:
+        if args.command == 'snapshot':
+            path = PyVersionTracker.refresh_snapshot(args.output, url=args.url)
+            print(f'Release snapshot written to {path}')
+        elif args.command == 'export':
+            path = PyVersionTracker().export_index(args.output, args.format, url=args.url)
+            print(f'Release index exported to {path}')
+        elif args.command == 'check':
+            return _check(args)
+        elif args.command == 'serve':
+            return _serve(args)
+    except PyVersionException as error:
+        print(error, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,194 @@
+import os
+import json
+import time
+from pathlib import Path
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+CACHE_DIR_ENV = 'PY_VERSION_TRACKER_CACHE_DIR'
+CACHE_TTL_ENV = 'PY_VERSION_TRACKER_CACHE_TTL'
+OFFLINE_ENV = 'PY_VERSION_TRACKER_OFFLINE'
+SNAPSHOT_ENV = 'PY_VERSION_TRACKER_SNAPSHOT'
+DEFAULT_TTL = 6 * 60 * 60
+_DISABLED = frozenset({'', '0', 'off', 'false', 'none'})
+
+
+def atomic_write_json(__path: Union[str, os.PathLike], __data: Any) -> Path:
+    """Write JSON to a temporary file in the target directory and atomically move it into place."""
+    return atomic_write_bytes(__path, json.dumps(__data, separators=(',', ':')).encode('utf-8'))
+
+
+def atomic_write_bytes(__path: Union[str, os.PathLike], __data: bytes) -> Path:
+    """Write bytes to a temporary file in the target directory and atomically move it into place."""
+    import tempfile
+
+    path = Path(__path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.stem}-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            tmp.write(__data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return path
+
+
+def offline_enabled(offline: Optional[bool]=None) -> bool:
+    """Resolve offline mode from an explicit flag or the 'PY_VERSION_TRACKER_OFFLINE' variable."""
+    if offline is not None:
+        return bool(offline)
+    return os.environ.get(OFFLINE_ENV, '').strip().lower() not in _DISABLED
+
+
+def default_snapshot_path() -> Path:
+    """Location 'PyVersionTracker.refresh_snapshot' writes to by default."""
+    return SnapshotCache.default_directory() / 'releases.json'
+
+
+def find_snapshot(snapshot: Union[str, os.PathLike, None]=None) -> Optional[Path]:
+    """Locate the release snapshot used in offline mode.
+
+    Candidates are checked in order: the explicit 'snapshot' path, the
+    'PY_VERSION_TRACKER_SNAPSHOT' variable and finally the user's refreshed snapshot.
+
+    Returns:
+        Optional[Path]: The first existing snapshot, or None if there is none.
+    """
+    if snapshot is not None:
+        return Path(snapshot).expanduser()
+    if env_snapshot := os.environ.get(SNAPSHOT_ENV):
+        return Path(env_snapshot).expanduser()
+    path = default_snapshot_path()
+    return path if path.is_file() else None
+
+
+class CacheEntry(NamedTuple):
+    """A cached snapshot of one downloads page together with its HTTP validators."""
+    url: str
+    fetched_at: float
+    etag: Optional[str]
+    last_modified: Optional[str]
+    payload: Dict[str, Any]
+
+
+class SnapshotCache(NamedTuple):
+    """
+    ### Persistent on-disk cache of parsed release indexes.
+
+    Each downloads page URL maps to one compact JSON file holding the serialized
+    'ReleaseIndex' and the ETag/Last-Modified validators of the response it was
+    parsed from. Writes are atomic (write to a temporary file, then 'os.replace')
+    and refreshes are serialized across processes with an advisory file lock.
+
+    Attributes:
+        directory: Directory the snapshot files are stored in.
+        ttl: Seconds a snapshot is served without revalidation.
+    """
+    directory: Path
+    ttl: float = DEFAULT_TTL
+
+    @classmethod
+    def default_directory(cls) -> Path:
+        base = os.environ.get('XDG_CACHE_HOME') or os.environ.get('LOCALAPPDATA')
+        return Path(base or Path.home() / '.cache') / 'py_version_tracker'
+
+    @classmethod
+    def from_config(cls,
+                    cache_dir: Union[str, os.PathLike, bool, None]=None,
+                    ttl: Optional[float]=None) -> Optional['SnapshotCache']:
+        """Resolve the cache configuration from arguments and environment variables.
+
+        Args:
+            cache_dir: Cache directory, False to disable the cache, or None to read
+                'PY_VERSION_TRACKER_CACHE_DIR' (default is the user cache directory).
+            ttl: Seconds a snapshot stays fresh, or None to read 'PY_VERSION_TRACKER_CACHE_TTL'.
+
+        Returns:
+            Optional[SnapshotCache]: The configured cache, or None if caching is disabled.
+
+        Raises:
+            None
+        """
+        # Resolution is memoized on the arguments and the environment it reads, since a
+        # tracker is constructed for every classmethod query.
+        return cls._resolve(cache_dir, ttl,
+                            os.environ.get(CACHE_DIR_ENV), os.environ.get(CACHE_TTL_ENV),
+                            os.environ.get('XDG_CACHE_HOME'), os.environ.get('LOCALAPPDATA'))
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _resolve(cls, cache_dir, ttl, env_dir, env_ttl, *_base_dirs) -> Optional['SnapshotCache']:
+        if cache_dir is None:
+            cache_dir = env_dir
+            if cache_dir is not None and cache_dir.strip().lower() in _DISABLED:
+                return None
+        if cache_dir is False:
+            return None
+        if ttl is None:
+            ttl = float(env_ttl or DEFAULT_TTL)
+        directory = Path(cache_dir) if cache_dir not in (None, True) else cls.default_directory()
+        return cls(directory.expanduser(), float(ttl))
+
+    def path_for(self, __url: str) -> Path:
+        import hashlib
+
+        return self.directory / f'{hashlib.sha256(__url.encode()).hexdigest()[:24]}.json'
+
+    def is_fresh(self, __entry: CacheEntry, now: Optional[float]=None) -> bool:
+        age = (time.time() if now is None else now) - __entry.fetched_at
+        return 0 <= age < self.ttl
+
+    def load(self, __url: str) -> Optional[CacheEntry]:
+        """Read the snapshot stored for a URL.
+
+        Returns:
+            Optional[CacheEntry]: The stored entry, or None if it is missing or unreadable.
+        """
+        try:
+            with open(self.path_for(__url), encoding='utf-8') as snapshot:
+                entry = CacheEntry(**json.load(snapshot))
+        except (OSError, ValueError, TypeError):
+            return None
+        return entry if entry.url == __url else None
+
+    def store(self, __entry: CacheEntry) -> None:
+        """Atomically write a snapshot, replacing any previous one for the same URL."""
+        atomic_write_json(self.path_for(__entry.url), __entry._asdict())
+
+    @contextmanager
+    def lock(self, __url: str) -> Iterator[None]:
+        """Hold an exclusive advisory lock on a URL's snapshot across processes."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        lock_path = self.path_for(__url).with_suffix('.lock')
+        with open(lock_path, 'a+b') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:  # pragma: no cover - Windows
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:  # pragma: no cover - Windows
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+__all__ = ('SnapshotCache', 'CacheEntry')
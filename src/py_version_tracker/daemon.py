@@ -0,0 +1,289 @@
+import os
+import json
+import time
+import threading
+# socket, socketserver, random and logging are imported on first use to keep 'import py_version_tracker' cheap.
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+from .cache import atomic_write_json
+
+
+def _logger():
+    import logging
+
+    return logging.getLogger(__name__)
+
+
+class ReleaseEvent(NamedTuple):
+    """One change between two release indexes, e.g. '3.13.1 released' or '3.8 went end-of-life'."""
+    kind: str
+    version: str
+    detail: Optional[str] = None
+
+    RELEASED = 'released'
+    NEW_BRANCH = 'new_branch'
+    STATUS_CHANGED = 'status_changed'
+    END_OF_LIFE = 'end_of_life'
+
+    def __str__(self) -> str:
+        return {self.RELEASED: f'{self.version} released',
+                self.NEW_BRANCH: f'{self.version} branch added ({self.detail})',
+                self.STATUS_CHANGED: f'{self.version} status changed ({self.detail})',
+                self.END_OF_LIFE: f'{self.version} went end-of-life',
+                }.get(self.kind, f'{self.version} {self.kind}')
+
+
+def diff_indexes(__old, __new) -> List[ReleaseEvent]:
+    """List the changes between two release indexes.
+
+    Args:
+        __old: The previous 'ReleaseIndex'.
+        __new: The current 'ReleaseIndex'.
+
+    Returns:
+        List[ReleaseEvent]: New releases (sorted by version), then branch changes: added
+            branches, status changes, and branches that reached or dropped off end-of-life.
+    """
+    events = [ReleaseEvent(ReleaseEvent.RELEASED, record.version, record.release_date)
+                for record in __new.versions if record.version not in __old.by_version]
+    old_active = {row[0]: row[1] for row in __old.active}
+    new_active = {row[0]: row[1] for row in __new.active}
+    for branch, status in new_active.items():
+        if branch not in old_active:
+            events.append(ReleaseEvent(ReleaseEvent.NEW_BRANCH, branch, status))
+    for branch, status in old_active.items():
+        new_status = new_active.get(branch)
+        if new_status is None or (new_status == 'end-of-life' != status):
+            events.append(ReleaseEvent(ReleaseEvent.END_OF_LIFE, branch, status))
+        elif new_status != status:
+            events.append(ReleaseEvent(ReleaseEvent.STATUS_CHANGED, branch, f'{status} -> {new_status}'))
+    return events
+
+
+class ReleaseRefresher:
+    """
+    ### Keep one release index fresh and share it with local consumers.
+
+    A background thread reloads the index every 'interval' seconds (with random
+    jitter, and exponential backoff after failures), publishes it to a shared
+    snapshot file and/or a Unix socket, and passes every 'ReleaseEvent' to the
+    subscribed callbacks. Consumers then read the snapshot (offline mode) or ask
+    the socket ('request_index') instead of each scraping python.org.
+
+    Attributes:
+        interval: Seconds between successful refreshes.
+        jitter: Fraction of the delay randomly added or removed (0.1 is +/-10%).
+        backoff: First retry delay in seconds after a failed refresh, doubled per failure up to 'interval'.
+        snapshot: Shared snapshot file rewritten (atomically) whenever the index changes, or None.
+        socket_path: Unix socket the current snapshot is served on, or None.
+        index: The latest 'ReleaseIndex' (None before the first successful refresh).
+        failures: Consecutive failed refreshes.
+    """
+
+    def __init__(self, tracker=None, *,
+                interval: float=3600,
+                jitter: float=0.1,
+                backoff: float=30,
+                snapshot: Union[str, os.PathLike, None]=None,
+                socket_path: Union[str, os.PathLike, None]=None,
+                url: str=''):
+        from .py_version_tracker import PyVersionTracker
+
+        self.tracker = tracker if tracker is not None else PyVersionTracker()
+        self.interval = float(interval)
+        self.jitter = float(jitter)
+        self.backoff = float(backoff)
+        self.snapshot: Optional[Path] = Path(snapshot).expanduser() if snapshot is not None else None
+        self.socket_path: Optional[Path] = Path(socket_path).expanduser() if socket_path is not None else None
+        self.url = url
+        self.index = None
+        self.failures = 0
+        self._payload = b''
+        self._ready = threading.Event()
+        self._callbacks: List[Callable[[ReleaseEvent], Any]] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._server = None
+        self._lock = threading.Lock()
+
+    def subscribe(self, __callback: Callable[[ReleaseEvent], Any]) -> Callable[[ReleaseEvent], Any]:
+        """Register a callback for every 'ReleaseEvent' (usable as a decorator)."""
+        self._callbacks.append(__callback)
+        return __callback
+
+    def unsubscribe(self, __callback: Callable[[ReleaseEvent], Any]) -> None:
+        self._callbacks.remove(__callback)
+
+    def refresh(self) -> List[ReleaseEvent]:
+        """Reload the index once, publish it if it changed and notify subscribers.
+
+        Returns:
+            List[ReleaseEvent]: Changes since the previous refresh (empty on the first one).
+
+        Raises:
+            PyVersionException: Raised if the index cannot be reloaded.
+        """
+        index = self.tracker.reload(self.url)
+        with self._lock:
+            previous, self.index = self.index, index
+            events = [] if previous is None else diff_indexes(previous, index)
+            if previous is None or index.to_dict() != previous.to_dict():
+                self._publish(index)
+        for event in events:
+            for callback in list(self._callbacks):
+                try:
+                    callback(event)
+                except Exception:
+                    _logger().exception('Release event callback %r failed for %s', callback, event)
+        return events
+
+    def _publish(self, __index) -> None:
+        payload = {'url': self.url or self.tracker._MAIN_PG, 'generated_at': time.time(), **__index.to_dict()}
+        self._payload = json.dumps(payload, separators=(',', ':')).encode()
+        if self.snapshot is not None:
+            atomic_write_json(self.snapshot, payload)
+        self._ready.set()
+
+    def next_delay(self) -> float:
+        """Seconds until the next refresh, from the interval or backoff with jitter applied."""
+        import random
+
+        delay = self.interval if not self.failures else \
+                min(self.interval, self.backoff * 2 ** (self.failures - 1))
+        return max(0.0, delay * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+    def run_forever(self) -> None:
+        """Refresh until 'stop' is called, serving the socket (if configured) meanwhile."""
+        from .py_version_tracker import PyVersionException
+
+        self._serve()
+        try:
+            while not self._stop.is_set():
+                try:
+                    self.refresh()
+                    self.failures = 0
+                except PyVersionException as refresh_error:
+                    self.failures += 1
+                    _logger().warning('Release index refresh failed (%d in a row): %s', self.failures, refresh_error)
+                self._stop.wait(self.next_delay())
+        finally:
+            self._shutdown_server()
+
+    def start(self) -> 'ReleaseRefresher':
+        """Run 'run_forever' on a daemon thread.
+
+        The socket (if configured) is opened before the thread starts, so a socket that
+        cannot be served raises here rather than on the background thread.
+
+        Raises:
+            PyVersionException: Raised if the socket is served by another refresher or cannot be bound.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._serve()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.run_forever, name='py-version-tracker-refresher', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float]=None) -> None:
+        """Stop refreshing and close the socket."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def __enter__(self) -> 'ReleaseRefresher':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _serve(self) -> None:
+        if self.socket_path is None or self._server is not None:
+            return
+        import socketserver
+        from .py_version_tracker import PyVersionException
+
+        if not hasattr(socketserver, 'ThreadingUnixStreamServer'):
+            raise PyVersionException('Serving the release index over a Unix socket is not supported on this platform.')
+
+        refresher = self
+
+        class _Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                if not refresher._payload:
+                    refresher._ready.wait(5)
+                self.request.sendall(refresher._payload)
+
+        if self.socket_path.is_socket():
+            if self._socket_in_use():
+                raise PyVersionException(
+                    f'Another refresher is already serving the release index on {str(self.socket_path)!r}.'
+                    )
+            # Nothing is listening: the socket was left behind by a refresher that did not shut down.
+            self.socket_path.unlink()
+        try:
+            self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+            self._server = socketserver.ThreadingUnixStreamServer(str(self.socket_path), _Handler)
+        except OSError as bind_error:
+            raise PyVersionException(
+                f'Unable to serve the release index on {str(self.socket_path)!r}.'
+                ) from bind_error
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name='py-version-tracker-socket', daemon=True).start()
+
+    def _socket_in_use(self) -> bool:
+        import socket
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.settimeout(1.0)
+            try:
+                probe.connect(str(self.socket_path))
+            except OSError:
+                return False
+        return True
+
+    def _shutdown_server(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        try:
+            self.socket_path.unlink()
+        except OSError:
+            pass
+
+
+def request_index(__socket_path: Union[str, os.PathLike], timeout: float=5.0) -> Any:
+    """Get the current release index from a 'ReleaseRefresher' socket.
+
+    Args:
+        __socket_path: The refresher's Unix socket.
+        timeout: Seconds to wait for the connection and the response (default is 5).
+
+    Returns:
+        ReleaseIndex: The index the refresher last published.
+
+    Raises:
+        PyVersionException: Raised if the socket cannot be reached or returns no index.
+    """
+    import socket
+    from .py_version_tracker import PyVersionException, ReleaseIndex
+
+    chunks = []
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(os.fspath(__socket_path))
+            while chunk := client.recv(65536):
+                chunks.append(chunk)
+        data: Dict[str, Any] = json.loads(b''.join(chunks))
+    except (OSError, AttributeError, ValueError) as socket_error:
+        raise PyVersionException(
+            f'Unable to read the release index from {os.fspath(__socket_path)!r}.'
+            ) from socket_error
+    return ReleaseIndex.from_dict(data)
+
+
+__all__ = ('ReleaseRefresher', 'ReleaseEvent', 'diff_indexes', 'request_index')
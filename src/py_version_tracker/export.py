@@ -0,0 +1,404 @@
+import os
+import sys
+import json
+import struct
+from array import array
+from collections.abc import Sequence
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .cache import atomic_write_bytes
+from .py_version_tracker import PyVersionException, ReleaseIndex, _parse_branch_date
+
+
+EXPORT_FORMATS = ('jsonl', 'csv', 'binary')
+_SUFFIXES = {'.jsonl': 'jsonl', '.ndjson': 'jsonl', '.csv': 'csv', '.pvti': 'binary'}
+
+# Every JSON Lines / CSV row has a 'kind' ('featured', 'branch' or 'release'); fields
+# that do not apply to a kind are left empty.
+CSV_FIELDS = ('kind', 'version', 'major', 'minor', 'micro', 'release_date', 'date', 'deprecated',
+            'status', 'start', 'end', 'schedule', 'end_of_life', 'url')
+
+# Binary layout: magic, (format version, header length) as little-endian uint32s, the JSON
+# header, then every column buffer 8-byte aligned. Numbers are little-endian; strings are
+# stored Arrow-style as int32 offsets (rows + 1) into one UTF-8 data buffer.
+_MAGIC = b'PVTINDEX'
+_PREFIX = struct.Struct('<II')
+_BINARY_VERSION = 1
+_ALIGN = 8
+_TYPECODES = {'uint8': 'B', 'uint16': 'H', 'int32': 'i'}
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+
+def _split_version(__version: str) -> Tuple[int, ...]:
+    parts = tuple(int(part) for part in __version.split('.') if part.isdigit())
+    return parts + (0,) * (3 - len(parts))
+
+
+def _iso(__date: Optional[date]) -> Optional[str]:
+    return None if __date is None else __date.isoformat()
+
+
+def _branch_rows(__index: ReleaseIndex) -> List[Dict[str, Any]]:
+    rows = []
+    for version, status, start, end, schedule in __index.active:
+        major, minor, _ = _split_version(version)
+        rows.append({'version': version, 'major': major, 'minor': minor, 'status': status,
+                    'start': start, 'end': end, 'schedule': schedule,
+                    'end_of_life': _iso(_parse_branch_date(end))})
+    return rows
+
+
+def _release_rows(__index: ReleaseIndex) -> List[Dict[str, Any]]:
+    branches = {row['version']: row for row in _branch_rows(__index)}
+    rows = []
+    for record in __index.records:
+        major, minor, micro = record.version_info
+        branch = branches.get(f'{major}.{minor}')
+        if branch is not None:
+            status, end_of_life = branch['status'], branch['end_of_life']
+        else:
+            # Branches drop off the page once they reach end-of-life.
+            status, end_of_life = ('end-of-life' if record.deprecated else None), None
+        rows.append({'version': record.version, 'major': major, 'minor': minor, 'micro': micro,
+                    'release_date': record.release_date, 'date': _iso(record.date),
+                    'deprecated': record.deprecated, 'status': status, 'end_of_life': end_of_life,
+                    'url': __index.links.get(record.version)})
+    return rows
+
+
+def _resolve_format(__path: Path, __format: Optional[str]) -> str:
+    fmt = __format or _SUFFIXES.get(__path.suffix.lower())
+    if fmt not in EXPORT_FORMATS:
+        raise PyVersionException(
+            f'Unknown export format {fmt or __path.suffix!r}. '
+            f'Choose one of {EXPORT_FORMATS} or use a {tuple(_SUFFIXES)} file extension.'
+            )
+    return fmt
+
+
+def export_index(__index: ReleaseIndex, __path: Union[str, os.PathLike], format: Optional[str]=None) -> Path:
+    """Write a release index for downstream jobs (pandas, Spark, other workers).
+
+    Args:
+        __index: The 'ReleaseIndex' to export.
+        __path: Destination file, replaced atomically.
+        format: 'jsonl', 'csv' or 'binary' (default is inferred from the extension:
+            '.jsonl'/'.ndjson', '.csv' or '.pvti').
+
+    Returns:
+        Path: Path of the written file.
+
+    Raises:
+        PyVersionException: Raised for an unknown format.
+    """
+    path = Path(__path).expanduser()
+    writer = {'jsonl': _dump_jsonl, 'csv': _dump_csv, 'binary': _dump_binary}[_resolve_format(path, format)]
+    return atomic_write_bytes(path, writer(__index))
+
+
+def import_index(__path: Union[str, os.PathLike], format: Optional[str]=None) -> ReleaseIndex:
+    """Rebuild a release index from a file written by 'export_index'.
+
+    Args:
+        __path: The exported file.
+        format: 'jsonl', 'csv' or 'binary' (default is inferred from the extension).
+
+    Returns:
+        ReleaseIndex: The restored index.
+
+    Raises:
+        PyVersionException: Raised for an unknown format or a file that is not an exported index.
+    """
+    path = Path(__path).expanduser()
+    fmt = _resolve_format(path, format)
+    if fmt == 'binary':
+        with MappedIndex(path) as mapped:
+            return mapped.to_index()
+    try:
+        with open(path, encoding='utf-8', newline='') as exported:
+            return _index_from_rows(_load_csv(exported) if fmt == 'csv' else _load_jsonl(exported))
+    except (OSError, ValueError, KeyError, TypeError) as export_error:
+        raise PyVersionException(f'Unable to read the exported release index: {str(path)!r}') from export_error
+
+
+def _rows(__index: ReleaseIndex) -> Iterator[Dict[str, Any]]:
+    yield {'kind': 'featured', 'version': __index.featured}
+    for row in _branch_rows(__index):
+        yield {'kind': 'branch', **row}
+    for row in _release_rows(__index):
+        yield {'kind': 'release', **row}
+
+
+def _index_from_rows(__rows) -> ReleaseIndex:
+    releases, active, featured, links = [], [], None, {}
+    for row in __rows:
+        kind = row.get('kind')
+        if kind == 'release':
+            releases.append((row['version'], row['release_date']))
+            # Exports written before release links were captured have no 'url'.
+            if row.get('url'):
+                links.setdefault(row['version'], row['url'])
+        elif kind == 'branch':
+            active.append(tuple(row[field] for field in ('version', 'status', 'start', 'end', 'schedule')))
+        elif kind == 'featured':
+            featured = row['version']
+    if featured is None:
+        raise PyVersionException('The exported release index has no featured version row.')
+    return ReleaseIndex(releases, active, featured, links)
+
+
+def _dump_jsonl(__index: ReleaseIndex) -> bytes:
+    return ''.join(json.dumps(row, separators=(',', ':')) + '\n' for row in _rows(__index)).encode('utf-8')
+
+
+def _load_jsonl(__file) -> Iterator[Dict[str, Any]]:
+    return (json.loads(line) for line in __file if line.strip())
+
+
+def _dump_csv(__index: ReleaseIndex) -> bytes:
+    import io
+    import csv
+
+    buffer = io.StringIO(newline='')
+    writer = csv.DictWriter(buffer, CSV_FIELDS, lineterminator='\n')
+    writer.writeheader()
+    for row in _rows(__index):
+        writer.writerow({field: ('' if value is None else str(value).lower() if isinstance(value, bool) else value)
+                        for field, value in row.items()})
+    return buffer.getvalue().encode('utf-8')
+
+
+def _load_csv(__file) -> Iterator[Dict[str, Any]]:
+    import csv
+
+    return csv.DictReader(__file)
+
+
+def _binary_tables(__index: ReleaseIndex) -> Dict[str, Dict[str, Tuple[str, Any]]]:
+    ordinal = lambda __iso: date.fromisoformat(__iso).toordinal() if __iso else 0
+    releases, branches = _release_rows(__index), _branch_rows(__index)
+    column = lambda rows, field: [row[field] for row in rows]
+    return {
+        'releases': {
+            'version': ('utf8', column(releases, 'version')),
+            'major': ('uint16', column(releases, 'major')),
+            'minor': ('uint16', column(releases, 'minor')),
+            'micro': ('uint16', column(releases, 'micro')),
+            'release_date': ('utf8', column(releases, 'release_date')),
+            'date': ('int32', [ordinal(row['date']) for row in releases]),
+            'deprecated': ('uint8', [bool(row['deprecated']) for row in releases]),
+            'status': ('utf8', [row['status'] or '' for row in releases]),
+            'end_of_life': ('int32', [ordinal(row['end_of_life']) for row in releases]),
+            'url': ('utf8', [row['url'] or '' for row in releases]),
+            },
+        'branches': {
+            'version': ('utf8', column(branches, 'version')),
+            'major': ('uint16', column(branches, 'major')),
+            'minor': ('uint16', column(branches, 'minor')),
+            'status': ('utf8', column(branches, 'status')),
+            'start': ('utf8', column(branches, 'start')),
+            'end': ('utf8', column(branches, 'end')),
+            'schedule': ('utf8', column(branches, 'schedule')),
+            'end_of_life': ('int32', [ordinal(row['end_of_life']) for row in branches]),
+            },
+        }
+
+
+def _numeric_bytes(__typecode: str, __values) -> bytes:
+    values = array(__typecode, __values)
+    if not _LITTLE_ENDIAN:
+        values.byteswap()
+    return values.tobytes()
+
+
+def _dump_binary(__index: ReleaseIndex) -> bytes:
+    body = bytearray()
+
+    def _append(__buffer: bytes) -> List[int]:
+        body.extend(b'\0' * (-len(body) % _ALIGN))
+        span = [len(body), len(__buffer)]
+        body.extend(__buffer)
+        return span
+
+    tables = {}
+    for table, columns in _binary_tables(__index).items():
+        layout, rows = {}, 0
+        for name, (kind, values) in columns.items():
+            rows = len(values)
+            if kind == 'utf8':
+                encoded = [value.encode('utf-8') for value in values]
+                offsets = [0]
+                for item in encoded:
+                    offsets.append(offsets[-1] + len(item))
+                layout[name] = {'type': kind,
+                                'offsets': _append(_numeric_bytes('i', offsets)),
+                                'data': _append(b''.join(encoded))}
+            else:
+                layout[name] = {'type': kind, 'data': _append(_numeric_bytes(_TYPECODES[kind], values))}
+        tables[table] = {'rows': rows, 'columns': layout}
+
+    header = json.dumps({'featured': __index.featured, 'tables': tables}, separators=(',', ':')).encode('utf-8')
+    prefix = _MAGIC + _PREFIX.pack(_BINARY_VERSION, len(header)) + header
+    return bytes(prefix + b'\0' * (-len(prefix) % _ALIGN) + body)
+
+
+class StringColumn(Sequence):
+    """Read-only UTF-8 string column of a 'MappedIndex', decoded one item at a time."""
+    __slots__ = ('_offsets', '_data')
+
+    def __init__(self, __offsets, __data):
+        self._offsets = __offsets
+        self._data = __data
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, __index):
+        if isinstance(__index, slice):
+            return [self[i] for i in range(*__index.indices(len(self)))]
+        if __index < 0:
+            __index += len(self)
+        if not 0 <= __index < len(self):
+            raise IndexError('StringColumn index out of range')
+        return bytes(self._data[self._offsets[__index]:self._offsets[__index + 1]]).decode('utf-8')
+
+
+class MappedIndex:
+    """
+    ### Zero-copy, read-only view of a binary ('.pvti') release index export.
+
+    The file is memory-mapped and numeric columns are returned as 'memoryview's
+    over the mapping (e.g. 'numpy.frombuffer(mapped.column("releases", "major"),
+    "<u2")'), so large consumers only page in the columns they read. Date columns
+    hold 'datetime.date.toordinal()' values, 0 where the date is unknown.
+
+    Columns stay valid after the mapping is closed (the file is unmapped once the
+    last of them is garbage collected), but no new columns can be read from it.
+
+    Attributes:
+        path: The mapped file.
+        featured: Version advertised by the page's download buttons.
+    """
+
+    def __init__(self, __path: Union[str, os.PathLike]):
+        import mmap
+
+        self.path = Path(__path).expanduser()
+        self._closed = False
+        try:
+            with open(self.path, 'rb') as exported:
+                self._mmap = mmap.mmap(exported.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as map_error:
+            raise PyVersionException(f'Unable to map the exported release index: {str(self.path)!r}') from map_error
+        try:
+            self._view = memoryview(self._mmap)
+            prefix_end = len(_MAGIC) + _PREFIX.size
+            if bytes(self._view[:len(_MAGIC)]) != _MAGIC:
+                raise ValueError('bad magic number')
+            version, header_size = _PREFIX.unpack(self._view[len(_MAGIC):prefix_end])
+            if version != _BINARY_VERSION:
+                raise ValueError(f'unsupported format version {version}')
+            header = json.loads(bytes(self._view[prefix_end:prefix_end + header_size]))
+            self.featured: str = header['featured']
+            self._tables: Dict[str, Dict[str, Any]] = header['tables']
+            body_start = prefix_end + header_size
+            self._body = self._view[body_start + (-body_start % _ALIGN):]
+        except (ValueError, KeyError, TypeError, struct.error) as header_error:
+            self.close()
+            raise PyVersionException(
+                f'{str(self.path)!r} is not a binary release index export.'
+                ) from header_error
+
+    @property
+    def tables(self) -> Tuple[str, ...]:
+        return tuple(self._tables)
+
+    def columns(self, __table: str) -> Tuple[str, ...]:
+        return tuple(self._table(__table)['columns'])
+
+    def rows(self, __table: str) -> int:
+        return self._table(__table)['rows']
+
+    def _table(self, __table: str) -> Dict[str, Any]:
+        try:
+            return self._tables[__table]
+        except KeyError:
+            raise PyVersionException(f'Unknown table {__table!r}; expected one of {self.tables}.') from None
+
+    def _buffer(self, __span) -> memoryview:
+        start, size = __span
+        return self._body[start:start + size]
+
+    def column(self, __table: str, __name: str) -> Union[memoryview, array, StringColumn]:
+        """Get one column of a table ('releases' or 'branches').
+
+        Args:
+            __table: Table name.
+            __name: Column name (see 'columns').
+
+        Returns:
+            A 'memoryview' for numeric columns ('array' copy on big-endian hosts),
+            or a 'StringColumn' for text columns.
+
+        Raises:
+            PyVersionException: Raised for unknown tables or columns, or if the mapping is closed.
+        """
+        if self._closed:
+            raise PyVersionException(f'{str(self.path)!r} has been closed.')
+        layout = self._table(__table)['columns'].get(__name)
+        if layout is None:
+            raise PyVersionException(f'Unknown column {__name!r}; expected one of {self.columns(__table)}.')
+        if layout['type'] == 'utf8':
+            return StringColumn(self._numeric(self._buffer(layout['offsets']), 'i'), self._buffer(layout['data']))
+        return self._numeric(self._buffer(layout['data']), _TYPECODES[layout['type']])
+
+    @staticmethod
+    def _numeric(__buffer: memoryview, __typecode: str) -> Union[memoryview, array]:
+        if _LITTLE_ENDIAN:
+            return __buffer.cast(__typecode)
+        values = array(__typecode, bytes(__buffer))
+        values.byteswap()
+        return values
+
+    def to_index(self) -> ReleaseIndex:
+        """Rebuild the full 'ReleaseIndex' from the mapped columns."""
+        versions = self.column('releases', 'version')
+        releases = zip(versions, self.column('releases', 'release_date'))
+        active = zip(*(self.column('branches', name) for name in ('version', 'status', 'start', 'end', 'schedule')))
+        links = {}
+        # Exports written before release links were captured have no 'url' column.
+        if 'url' in self.columns('releases'):
+            for version, url in zip(versions, self.column('releases', 'url')):
+                if url:
+                    links.setdefault(version, url)
+        return ReleaseIndex(releases, active, self.featured, links)
+
+    def close(self) -> None:
+        """Release the mapping.
+
+        Columns handed out by 'column' stay readable: while any is alive the file is
+        unmapped only once they have all been garbage collected.
+        """
+        self._closed = True
+        for view in ('_body', '_view'):
+            if (buffer := getattr(self, view, None)) is not None:
+                buffer.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Live column views still export the mapping; it is unmapped when they are collected.
+            pass
+
+    def __enter__(self) -> 'MappedIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({str(self.path)!r}, featured={self.featured!r})'
+
+
+__all__ = ('export_index', 'import_index', 'MappedIndex', 'StringColumn', 'EXPORT_FORMATS')
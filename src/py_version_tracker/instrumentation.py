@@ -0,0 +1,162 @@
+import threading
+from time import perf_counter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+
+class StatsEvent(NamedTuple):
+    """One measurement: a stage timing in seconds ('timing') or a counter increment ('counter')."""
+    name: str
+    kind: str
+    value: float
+
+
+class _Timer:
+    __slots__ = ('_stats', '_name', '_start')
+
+    def __init__(self, __stats: 'TrackerStats', __name: str):
+        self._stats = __stats
+        self._name = __name
+
+    def __enter__(self) -> '_Timer':
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stats.record(self._name, perf_counter() - self._start)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullTimer':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class TrackerStats:
+    """
+    ### Opt-in counters and per-stage timings of PyVersionTracker.
+
+    Stages timed: 'fetch' (HTTP requests), 'parse' (extracting the index columns
+    from HTML), 'index' (building a 'ReleaseIndex', including the deprecation
+    logic), 'soup' (building a BeautifulSoup tree) and 'clean_page' (tree scans).
+    Counters: 'http.requests', 'http.bytes', 'http.not_modified', 'http.errors',
+    'cache.index.hit/miss', 'cache.snapshot.hit/stale/miss/error' and 'cache.soup.hit/miss'.
+
+    Every measurement is also passed to 'callback' as a 'StatsEvent', e.g. to forward
+    it to a metrics system. The callback runs on the thread that did the work (often
+    the background I/O thread), so it should be quick and must not block.
+
+    Attributes:
+        callback: Optional callable receiving each 'StatsEvent'.
+    """
+
+    def __init__(self, callback: Optional[Callable[[StatsEvent], Any]]=None):
+        self.callback = callback
+        self._counters: Dict[str, float] = {}
+        self._timings: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self._previous: List[Optional['TrackerStats']] = []
+
+    def count(self, __name: str, __value: float=1) -> None:
+        with self._lock:
+            self._counters[__name] = self._counters.get(__name, 0) + __value
+        if self.callback is not None:
+            self.callback(StatsEvent(__name, 'counter', __value))
+
+    def record(self, __name: str, __seconds: float) -> None:
+        with self._lock:
+            timing = self._timings.get(__name)
+            if timing is None:
+                self._timings[__name] = [1, __seconds, __seconds]
+            else:
+                timing[0] += 1
+                timing[1] += __seconds
+                timing[2] = max(timing[2], __seconds)
+        if self.callback is not None:
+            self.callback(StatsEvent(__name, 'timing', __seconds))
+
+    def timer(self, __name: str) -> _Timer:
+        """Context manager recording the duration of its block under a stage name."""
+        return _Timer(self, __name)
+
+    @property
+    def counters(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._counters)
+
+    @property
+    def timings(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage call count, total, mean and max duration in seconds."""
+        with self._lock:
+            return {name: {'count': count, 'total_s': total, 'mean_s': total / count, 'max_s': longest}
+                    for name, (count, total, longest) in self._timings.items()}
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {'counters': self.counters, 'timings': self.timings}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+
+    def __enter__(self) -> 'TrackerStats':
+        self._previous.append(_state.active)
+        enable_instrumentation(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _state.active = self._previous.pop()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.as_dict()!r})'
+
+
+class _State:
+    __slots__ = ('active',)
+
+    def __init__(self):
+        self.active: Optional[TrackerStats] = None
+
+
+# Hooks check 'active' first, so disabled instrumentation costs one attribute lookup.
+_state = _State()
+
+
+def enable_instrumentation(stats: Optional[TrackerStats]=None,
+                        callback: Optional[Callable[[StatsEvent], Any]]=None) -> TrackerStats:
+    """Start recording into 'stats' (default is a new 'TrackerStats' with 'callback') and return it."""
+    _state.active = stats if stats is not None else TrackerStats(callback)
+    return _state.active
+
+
+def disable_instrumentation() -> Optional[TrackerStats]:
+    """Stop recording and return the stats that were active, if any."""
+    stats, _state.active = _state.active, None
+    return stats
+
+
+def active_stats() -> Optional[TrackerStats]:
+    """The stats currently being recorded into, or None when instrumentation is disabled."""
+    return _state.active
+
+
+def timer(__name: str) -> Any:
+    """Stage timer of the active stats, or a shared no-op context manager when disabled."""
+    stats = _state.active
+    return _NULL_TIMER if stats is None else _Timer(stats, __name)
+
+
+def count(__name: str, __value: float=1) -> None:
+    """Increment a counter of the active stats, if any."""
+    stats = _state.active
+    if stats is not None:
+        stats.count(__name, __value)
+
+
+__all__ = ('TrackerStats', 'StatsEvent', 'enable_instrumentation', 'disable_instrumentation', 'active_stats')
@@ -0,0 +1,263 @@
+import os
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+RELEASE_COLUMNS = ('release-number', 'release-date')
+ACTIVE_COLUMNS = ('release-version', 'release-status',
+                'release-start', 'release-end', 'release-pep')
+INDEX_COLUMNS = (*RELEASE_COLUMNS, *ACTIVE_COLUMNS)
+# Not a CSS class: the href of each 'release-number' link, aligned with that column ('' if none).
+LINK_COLUMN = 'release-link'
+FEATURED_CLASS = 'download-buttons'
+PARSER_ENV = 'PY_VERSION_TRACKER_PARSER'
+
+Columns = Dict[str, List[str]]
+
+# Elements BeautifulSoup's html.parser tree builder closes immediately.
+_VOID_ELEMENTS = frozenset({'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                            'keygen', 'link', 'menuitem', 'meta', 'param', 'source',
+                            'track', 'wbr', 'basefont', 'bgsound', 'command', 'frame',
+                            'image', 'isindex', 'nextid', 'spacer'})
+_TEXTLESS_ELEMENTS = frozenset({'script', 'style', 'template'})
+_INDEX_CLASSES = frozenset((*INDEX_COLUMNS, FEATURED_CLASS))
+
+
+def is_index_tag(__tag) -> bool:
+    """Whether a parsed tag contributes to the release index ('span' columns or the featured 'p')."""
+    classes = __tag.get('class') or ()
+    if __tag.name == 'span':
+        return any(c in INDEX_COLUMNS for c in classes)
+    return __tag.name == 'p' and FEATURED_CLASS in classes
+
+
+def columns_from_soup(__soup) -> Tuple[Columns, Optional[str]]:
+    """Collect the index columns and the featured version in one pass over a parsed tree.
+
+    Args:
+        __soup: BeautifulSoup object (full or strained) of the downloads page.
+
+    Returns:
+        Tuple: Mapping of CSS class to the cleaned text of each element (headings included,
+            plus the 'release-link' hrefs), and the featured version (None if the page has
+            no download buttons).
+    """
+    columns: Columns = {k: [] for k in (*INDEX_COLUMNS, LINK_COLUMN)}
+    featured = None
+    for tag in __soup.find_all(is_index_tag):
+        if tag.name == 'p':
+            if featured is None:
+                # The second child of the first button row holds 'Download Python X.Y.Z'.
+                featured = [i.get_text(strip=True) for i in tag][1].split()[-1]
+            continue
+        text = tag.get_text(strip=True)
+        for c in tag['class']:
+            if c in INDEX_COLUMNS:
+                columns[c].append(text)
+        if 'release-number' in tag['class']:
+            link = tag.find('a', href=True)
+            columns[LINK_COLUMN].append(link['href'] if link else '')
+    return columns, featured
+
+
+class _Capture:
+    __slots__ = ('names', 'level', 'slots', 'strings', 'children')
+
+    def __init__(self, names, level, slots, children=None):
+        self.names = names
+        self.level = level
+        self.slots = slots
+        self.strings: List[str] = []
+        self.children: Optional[List[List[str]]] = children
+
+
+class StreamingExtractor(HTMLParser):
+    """
+    ### Extract the release index columns without building a document tree.
+
+    Only the text of the 'release-*' spans, the first link href of each
+    'release-number' span and the first 'download-buttons' paragraph are materialized. Text is merged and stripped the same way
+    'Tag.get_text(strip=True)' does for BeautifulSoup's html.parser tree, and
+    end tags close elements the way its tree builder does, so the extracted
+    columns match '_clean_page' output.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.columns: Columns = {k: [] for k in (*INDEX_COLUMNS, LINK_COLUMN)}
+        self.featured: Optional[str] = None
+        self._link_slot: Optional[int] = None
+        self._open: List[str] = []
+        self._captures: List[_Capture] = []
+        self._pending: List[str] = []
+        self._featured_capture: Optional[_Capture] = None
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        data = ''.join(self._pending)
+        self._pending.clear()
+        if self._open and self._open[-1] in _TEXTLESS_ELEMENTS:
+            return
+        stripped = data.strip()
+        for capture in self._captures:
+            if stripped:
+                capture.strings.append(stripped)
+            if capture.children is not None:
+                if len(self._open) == capture.level + 1:
+                    capture.children.append([stripped] if stripped else [])
+                elif stripped:
+                    capture.children[-1].append(stripped)
+
+    def handle_data(self, data) -> None:
+        self._pending.append(data)
+
+    def handle_starttag(self, tag, attrs) -> None:
+        self._flush()
+        for capture in self._captures:
+            if capture.children is not None and len(self._open) == capture.level + 1:
+                capture.children.append([])
+        classes = next((value.split() for name, value in attrs if name == 'class' and value), ())
+        if tag == 'a' and self._link_slot is not None:
+            href = next((value for name, value in attrs if name == 'href' and value), None)
+            if href:
+                self.columns[LINK_COLUMN][self._link_slot] = href
+                self._link_slot = None
+        if tag in _VOID_ELEMENTS:
+            return
+        self._open.append(tag)
+        if tag == 'span' and not _INDEX_CLASSES.isdisjoint(classes):
+            names = [c for c in classes if c in INDEX_COLUMNS]
+            if names:
+                if 'release-number' in names:
+                    self._link_slot = len(self.columns[LINK_COLUMN])
+                    self.columns[LINK_COLUMN].append('')
+                slots = []
+                for name in names:
+                    slots.append(len(self.columns[name]))
+                    self.columns[name].append('')
+                self._captures.append(_Capture(names, len(self._open) - 1, slots))
+        elif tag == 'p' and FEATURED_CLASS in classes and self.featured is None \
+                and self._featured_capture is None:
+            self._featured_capture = _Capture((), len(self._open) - 1, (), children=[])
+            self._captures.append(self._featured_capture)
+
+    def handle_startendtag(self, tag, attrs) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag) -> None:
+        self._flush()
+        if tag not in self._open:
+            return
+        # Like BeautifulSoup, an end tag closes every element opened after its start tag.
+        level = len(self._open) - 1 - self._open[::-1].index(tag)
+        del self._open[level:]
+        self._close_captures(level)
+
+    def handle_comment(self, data) -> None:
+        self._flush()
+        for capture in self._captures:
+            if capture.children is not None and len(self._open) == capture.level + 1:
+                capture.children.append([])
+
+    def _close_captures(self, __level: int) -> None:
+        while self._captures and self._captures[-1].level >= __level:
+            capture = self._captures.pop()
+            if capture is self._featured_capture:
+                self._featured_capture = None
+                if self.featured is None:
+                    self.featured = ''.join(capture.children[1]).split()[-1]
+                continue
+            if 'release-number' in capture.names:
+                self._link_slot = None
+            text = ''.join(capture.strings)
+            for name, slot in zip(capture.names, capture.slots):
+                self.columns[name][slot] = text
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+        self._open.clear()
+        self._close_captures(0)
+
+
+def _is_index_class(__value) -> bool:
+    # Depending on the bs4 version, multi-valued classes are matched whole or one value at a time.
+    return bool(__value) and not _INDEX_CLASSES.isdisjoint(__value.split())
+
+
+def _soup_backend(__builder: str, strained: bool=False) -> Callable[[str], Tuple[Columns, Optional[str]]]:
+    def _extract(__html: str) -> Tuple[Columns, Optional[str]]:
+        from bs4 import BeautifulSoup, SoupStrainer
+
+        parse_only = SoupStrainer(['span', 'p'], class_=_is_index_class) if strained else None
+        return columns_from_soup(BeautifulSoup(__html, __builder, parse_only=parse_only))
+    return _extract
+
+
+def _stream_backend(__html: str) -> Tuple[Columns, Optional[str]]:
+    extractor = StreamingExtractor()
+    extractor.feed(__html)
+    extractor.close()
+    return extractor.columns, extractor.featured
+
+
+def _has_lxml() -> bool:
+    from importlib.util import find_spec
+
+    return find_spec('lxml') is not None
+
+
+BACKENDS: Dict[str, Callable[[str], Tuple[Columns, Optional[str]]]] = {
+    'html.parser': _soup_backend('html.parser'),
+    'lxml': _soup_backend('lxml'),
+    'strainer': _soup_backend('html.parser', strained=True),
+    'lxml-strainer': _soup_backend('lxml', strained=True),
+    'stream': _stream_backend,
+    }
+
+
+def available_backends() -> Tuple[str, ...]:
+    """Names of the parser backends usable in this environment."""
+    return tuple(name for name in BACKENDS if 'lxml' not in name or _has_lxml())
+
+
+def resolve_backend(__backend: Optional[str]=None) -> str:
+    """Resolve a backend name, reading 'PY_VERSION_TRACKER_PARSER' and expanding 'auto'.
+
+    'auto' selects the streaming extractor, which needs neither bs4 nor lxml and
+    is the fastest backend on the downloads page (see 'benchmarks/bench_parsers.py').
+    """
+    from .py_version_tracker import PyVersionException
+
+    backend = (__backend or os.environ.get(PARSER_ENV) or 'auto').lower()
+    if backend == 'auto':
+        return 'stream'
+    if backend not in BACKENDS:
+        raise PyVersionException(
+            f'Unknown parser backend {backend!r}. Choose from: auto, {", ".join(BACKENDS)}.'
+            )
+    if 'lxml' in backend and not _has_lxml():
+        raise PyVersionException(
+            f'The {backend!r} parser backend requires lxml to be installed.'
+            )
+    return backend
+
+
+def extract_columns(__html: str, backend: Optional[str]=None) -> Tuple[Columns, Optional[str]]:
+    """Extract the index columns and the featured version from downloads page HTML.
+
+    Args:
+        __html: HTML content of the downloads page.
+        backend: Parser backend name (default is 'PY_VERSION_TRACKER_PARSER' or 'auto').
+
+    Returns:
+        Tuple: Column mapping (headings included, plus the 'release-link' hrefs)
+            and the featured version.
+    """
+    return BACKENDS[resolve_backend(backend)](__html)
+
+
+__all__ = ('StreamingExtractor', 'available_backends', 'extract_columns')
@@ -1,20 +1,37 @@
+import os
 import re
 import sys
-import asyncio
-import operator
-import pypistats
+import time
+import atexit
 import operator
+import threading
 from platform import _sys_version
-from itertools import tee
-from bs4 import BeautifulSoup
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import urljoin
 from collections import namedtuple
-from functools import cache, cached_property
-from typing import (Any, List, NoReturn, Tuple,
-                    Match, Coroutine, Union,
+from collections.abc import Sequence
+from functools import cache, lru_cache
+from typing import (TYPE_CHECKING, Any, Dict, List, NoReturn, Tuple,
+                    Coroutine, Union,
                     NamedTuple, Generator, Iterator)
-from aiohttp import (ClientSession, TCPConnector,
-                    ClientConnectionError, ClientResponseError,
-                    ServerConnectionError, ServerDisconnectedError)
+
+from .parsers import (ACTIVE_COLUMNS, LINK_COLUMN, RELEASE_COLUMNS,
+                    columns_from_soup, extract_columns)
+from .session import SessionPool, SingleFlight, run_sync, shutdown
+from .versions import _parse_final, compare_many, parse_version, parse_versions, satisfies_minimum
+from .instrumentation import (TrackerStats, active_stats, disable_instrumentation,
+                            enable_instrumentation, count as _count, timer as _timer)
+from .cache import (CacheEntry, SnapshotCache, atomic_write_json,
+                    default_snapshot_path, find_snapshot, offline_enabled)
+
+if TYPE_CHECKING:
+    # asyncio, aiohttp, bs4 and pypistats are imported lazily on first use so that
+    # importing this module never triggers network or parsing work.
+    from bs4 import BeautifulSoup
 
 
 class PyVersionException(BaseException):
@@ -22,51 +39,616 @@ class PyVersionException(BaseException):
         super().__init__(*args)
 
 
+_MONTHS = {name: number for number, name in enumerate(
+            ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1)}
+
+
+def _parse_release_date(__date: str) -> Union[date, None]:
+    """Parse a downloads page date such as 'Oct. 2, 2023', 'Sept. 6, 2023' or 'June 6, 2023'."""
+    try:
+        month, day, year = __date.replace('.', ' ').replace(',', ' ').split()
+        return date(int(year), _MONTHS[month[:3].lower()], int(day))
+    except (ValueError, KeyError, AttributeError):
+        return None
+
+
+def _parse_branch_date(__date: str) -> Union[date, None]:
+    """Parse an active branch date such as '2019-10-14' or '2024-10-07 (planned)' ('2024-10' is the 1st of the month)."""
+    try:
+        parts = tuple(map(int, __date.split()[0].split('-')))
+        if len(parts) == 2:
+            parts += (1,)
+        return date(*parts) if len(parts) == 3 else None
+    except (ValueError, TypeError, AttributeError, IndexError):
+        return None
+
+
+def _as_date(__on) -> Union[date, NoReturn]:
+    """Coerce a 'date', 'datetime' or ISO 'YYYY-MM-DD' string to a 'date'."""
+    if isinstance(__on, date):
+        return __on.date() if hasattr(__on, 'date') else __on
+    try:
+        return date.fromisoformat(__on)
+    except (TypeError, ValueError):
+        raise PyVersionException(
+            f'Invalid date: {__on!r}.\n'
+            "Please use a 'datetime.date' or the format YYYY-MM-DD."
+            ) from None
+
+
+class PyVersion(namedtuple('PyVersion', ('version', 'release_date', 'deprecated',
+                                        'version_info', 'date'),
+                            defaults=[None]*5)):
+    """A stable release with its parsed (major, minor, micro) tuple and 'datetime.date' release date."""
+    __slots__ = ()
+    
+    @classmethod
+    def from_row(cls, version: str, release_date: str, deprecated: Union[bool, None]=None) -> 'PyVersion':
+        return cls(version, release_date, deprecated,
+                    PyVersionTracker.str2tuple(version), _parse_release_date(release_date))
+
+
+class PyActive(namedtuple('PyActive', ('version', 'status', 'start', 'end', 'schedule',
+                                        'start_date', 'end_date'),
+                            defaults=[None]*2)):
+    """An active release branch as listed on the downloads page, with its parsed first release and end-of-life dates.
+
+    'end_date' is the first day of the end-of-life month when the page only gives a month ('2024-10').
+    """
+    __slots__ = ()
+    
+    @classmethod
+    def from_row(cls, version: str, status: str, start: str, end: str, schedule: str) -> 'PyActive':
+        return cls(version, status, start, end, schedule, _parse_branch_date(start), _parse_branch_date(end))
+
+
+class PyFile(namedtuple('PyFile', ('name', 'url', 'operating_system', 'description',
+                                    'md5', 'size', 'signature', 'sigstore'))):
+    """A downloadable artifact listed on a release page."""
+    __slots__ = ()
+
+
+class PyRelease(namedtuple('PyRelease', (*PyVersion._fields, 'url', 'files', 'schedule', 'error'),
+                            defaults=(None,))):
+    """A 'PyVersion' enriched with its release page URL, artifacts and branch release schedule,
+    or the error its release page failed with."""
+    __slots__ = ()
+
+
+class PyVerdict(namedtuple('PyVerdict', ('host', 'sys_version', 'version', 'verdict'))):
+    """The outcome of checking one host's interpreter with 'version_checker_many'."""
+    __slots__ = ()
+    OK, BELOW_MINIMUM, DEPRECATED, UNKNOWN = 'ok', 'below_minimum', 'deprecated', 'unknown'
+
+
+class PyPackageStats(namedtuple('PyPackageStats', ('package', 'method', 'params', 'data', 'error'))):
+    """pypistats rows for one (method, package, params) request, or the error that request failed with."""
+    __slots__ = ()
+
+
+def _inventory_item(__item) -> Tuple[Any, Any]:
+    # Plain strings, (host, sys_version) pairs and CSV/JSONL rows with a 'host' column.
+    if isinstance(__item, str):
+        return None, __item
+    if isinstance(__item, dict):
+        return __item.get('host'), __item.get('sys_version', __item.get('version'))
+    try:
+        host, sys_version = __item
+    except (TypeError, ValueError):
+        return None, __item
+    return host, sys_version
+
+
+def _check_chunk(__deprecated: Dict[Tuple[int, int, int], bool],
+                __minimum: Tuple[int, int, int],
+                __chunk: List[Tuple[Any, Any]]) -> List[PyVerdict]:
+    """Verdicts for one chunk of (host, sys_version) pairs; runs in pool workers.
+
+    Pre-release and dev interpreters ('3.12.0rc1', '3.13.0a1+') are not running a
+    known release, so they are reported as unknown rather than as the final release.
+    """
+    verdicts = []
+    for host, sys_version in __chunk:
+        parsed = _parse_final(sys_version) if isinstance(sys_version, str) else None
+        if parsed is None or parsed not in __deprecated:
+            verdict = PyVerdict.UNKNOWN
+        elif parsed < __minimum:
+            verdict = PyVerdict.BELOW_MINIMUM
+        elif __deprecated[parsed]:
+            verdict = PyVerdict.DEPRECATED
+        else:
+            verdict = PyVerdict.OK
+        verdicts.append(PyVerdict(host, sys_version,
+                                None if parsed is None else '%d.%d.%d' % parsed, verdict))
+    return verdicts
+
+
+class ReleaseColumns(namedtuple('ReleaseColumns', ('versions', 'major', 'minor', 'micro',
+                                                    'date_ordinal', 'deprecated'))):
+    """
+    ### Columnar (parallel array) view of every release, in page order.
+    
+    Attributes:
+        versions: Tuple of version strings.
+        major, minor, micro: 'array' of unsigned shorts.
+        date_ordinal: 'array' of 'datetime.date.toordinal()' values (0 if the date is unknown).
+        deprecated: 'array' of 0/1 deprecation flags.
+    """
+    __slots__ = ()
+
+
+class VersionSequence(Sequence):
+    """
+    ### Immutable, re-iterable view of version records sorted by version.
+    
+    Supports 'len', indexing, slicing (which returns another 'VersionSequence')
+    and binary-search lookups by version string or integer tuple. Views are built
+    once per release index, so they can be shared freely across threads.
+    """
+    __slots__ = ('_items', '_keys')
+    
+    def __init__(self, __items=()):
+        pairs = sorted(((self._key(item.version), item) for item in __items),
+                        key=operator.itemgetter(0))
+        self._items: Tuple[NamedTuple, ...] = tuple(item for _, item in pairs)
+        self._keys: Tuple[Tuple[int, ...], ...] = tuple(key for key, _ in pairs)
+    
+    @classmethod
+    def _from_sorted(cls, __items, __keys) -> 'VersionSequence':
+        view = cls.__new__(cls)
+        view._items, view._keys = tuple(__items), tuple(__keys)
+        return view
+    
+    @staticmethod
+    def _key(__version) -> Tuple[int, ...]:
+        version = __version if isinstance(__version, tuple) else PyVersionTracker.str2tuple(__version)
+        return tuple(version) + (0,) * (3 - len(version))
+    
+    def __getitem__(self, __index):
+        if isinstance(__index, slice):
+            return self._from_sorted(self._items[__index], self._keys[__index])
+        return self._items[__index]
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def __iter__(self) -> Iterator[NamedTuple]:
+        return iter(self._items)
+    
+    def __reversed__(self) -> Iterator[NamedTuple]:
+        return reversed(self._items)
+    
+    def __contains__(self, __item) -> bool:
+        if isinstance(__item, str):
+            return self.find(__item) is not None
+        return __item in self._items
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, VersionSequence):
+            return self._items == other._items
+        if isinstance(other, (tuple, list)):
+            return list(self._items) == list(other)
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({list(self._items)!r})'
+    
+    def bisect_left(self, __version) -> int:
+        """Position of the first record whose version is >= the given version."""
+        return bisect_left(self._keys, self._key(__version))
+    
+    def bisect_right(self, __version) -> int:
+        """Position after the last record whose version is <= the given version."""
+        return bisect_right(self._keys, self._key(__version))
+    
+    def find(self, __version) -> Union[NamedTuple, None]:
+        """Get the record of a version (X.Y matches X.Y.0), or None if it is not in the view."""
+        key = self._key(__version)
+        idx = bisect_left(self._keys, key)
+        if idx < len(self._keys) and self._keys[idx] == key:
+            return self._items[idx]
+        return None
+    
+    def between(self, lo=None, hi=None, inclusive: bool=True) -> 'VersionSequence':
+        """Get the records whose versions fall between two bounds in O(log n + k).
+
+        Args:
+            lo: Lower bound version (default is unbounded).
+            hi: Upper bound version (default is unbounded). An inclusive X.Y bound
+                covers its whole minor series, e.g. '3.11' includes 3.11.6.
+            inclusive: Whether records equal to a bound are included (default is True).
+
+        Returns:
+            VersionSequence: The matching records, sorted by version.
+        """
+        start = 0 if lo is None else (self.bisect_left(lo) if inclusive else self.bisect_right(lo))
+        stop = len(self) if hi is None else (self._series_end(hi) if inclusive else self.bisect_left(hi))
+        return self[start:max(start, stop)]
+    
+    def _series_end(self, __version) -> int:
+        version = __version if isinstance(__version, tuple) else PyVersionTracker.str2tuple(__version)
+        if len(version) == 2:
+            return self.bisect_left((version[0], version[1] + 1, 0))
+        return self.bisect_right(version)
+    
+    def series(self, __series) -> 'VersionSequence':
+        """Get every record of a minor series, e.g. all patches of '3.10'."""
+        major, minor = PyVersionTracker.str2tuple(__series)[:2]
+        return self[self.bisect_left((major, minor, 0)):self.bisect_left((major, minor + 1, 0))]
+    
+    def latest_patches(self) -> 'VersionSequence':
+        """Get the newest record of each minor series."""
+        keys, items = self._keys, self._items
+        last = [i for i in range(len(keys)) if i + 1 == len(keys) or keys[i][:2] != keys[i + 1][:2]]
+        return self._from_sorted((items[i] for i in last), (keys[i] for i in last))
+
+
+class LifecycleIndex:
+    """
+    ### Precomputed date indexes over release dates and branch support windows.
+    
+    Releases are kept sorted by release date and branches by end-of-life date, and
+    the branch support windows ('start_date' up to, but excluding, 'end_date') are
+    cut into elementary intervals at every start and end date, each holding the
+    branches supported throughout it. Every query is a binary search, O(log n + k).
+    
+    Only branches listed on the downloads page (with parseable dates) are covered;
+    branches drop off the page once they reach end-of-life.
+    """
+    __slots__ = ('_release_days', '_releases', '_eol_days', '_eol_branches', '_bounds', '_segments')
+    
+    def __init__(self, __releases, __branches):
+        dated = sorted(((record.date.toordinal(), record.version_info, record)
+                        for record in __releases if record.date is not None),
+                        key=operator.itemgetter(0, 1))
+        self._release_days: Tuple[int, ...] = tuple(day for day, _, _ in dated)
+        self._releases: Tuple[PyVersion, ...] = tuple(record for _, _, record in dated)
+        
+        ending = sorted(((branch.end_date.toordinal(), branch) for branch in __branches
+                        if branch.end_date is not None), key=operator.itemgetter(0))
+        self._eol_days: Tuple[int, ...] = tuple(day for day, _ in ending)
+        self._eol_branches: Tuple[PyActive, ...] = tuple(branch for _, branch in ending)
+        
+        windows = [(branch.start_date.toordinal(), branch.end_date.toordinal(), branch)
+                    for branch in __branches
+                    if branch.start_date is not None and branch.end_date is not None
+                    and branch.start_date < branch.end_date]
+        # Segment i covers [bounds[i], bounds[i + 1]); the last one is always empty.
+        self._bounds: Tuple[int, ...] = tuple(sorted({day for start, end, _ in windows for day in (start, end)}))
+        self._segments: Tuple[VersionSequence, ...] = tuple(
+            VersionSequence(branch for start, end, branch in windows if start <= bound < end)
+            for bound in self._bounds)
+    
+    def supported_on(self, __on: date) -> VersionSequence:
+        """Branches whose support window contains a date."""
+        idx = bisect_right(self._bounds, __on.toordinal()) - 1
+        return self._segments[idx] if idx >= 0 else VersionSequence()
+    
+    def eol_between(self, __start: date, __end: date) -> VersionSequence:
+        """Branches whose end-of-life date falls between two dates (inclusive)."""
+        lo = bisect_left(self._eol_days, __start.toordinal())
+        hi = bisect_right(self._eol_days, __end.toordinal())
+        return VersionSequence(self._eol_branches[lo:max(lo, hi)])
+    
+    def released_between(self, __start: date, __end: date) -> Tuple[PyVersion, ...]:
+        """Releases published between two dates (inclusive), oldest first."""
+        lo = bisect_left(self._release_days, __start.toordinal())
+        hi = bisect_right(self._release_days, __end.toordinal())
+        return self._releases[lo:max(lo, hi)]
+    
+    def first_release_after(self, __on: date) -> Union[PyVersion, None]:
+        """The earliest release published after a date (the newest version if several share that day)."""
+        idx = bisect_right(self._release_days, __on.toordinal())
+        if idx == len(self._release_days):
+            return None
+        return self._releases[bisect_right(self._release_days, self._release_days[idx]) - 1]
+
+
+class ReleaseIndex:
+    """
+    ### Immutable, in-memory index of the python.org downloads page.
+    
+    The index is built in a single traversal of the parsed page and holds every
+    row the tracker serves from: all stable releases, the active release branches
+    and the featured (latest stable) version.
+    
+    Attributes:
+        releases: Tuple of (version, release_date) pairs in page order.
+        active: Tuple of (version, status, start, end, schedule) rows in page order.
+        featured: Version advertised by the page's download buttons.
+        links: Read-only mapping of version string to the href of its release page link.
+        records: Tuple of 'PyVersion' records (parsed, with deprecation) in page order.
+        versions: 'VersionSequence' of every release record, sorted by version.
+        active_versions: 'VersionSequence' of the active branches ('PyActive'), sorted by version.
+        unsupported_versions: 'VersionSequence' of the deprecated release records, sorted by version.
+        by_version: Read-only mapping of version string to its 'PyVersion' record.
+        deprecated: Read-only mapping of version string to its deprecation flag.
+        lifecycle: 'LifecycleIndex' over release and end-of-life dates (built on first access).
+    """
+    __slots__ = ('releases', 'active', 'featured', 'links', 'records', 'by_version', 'deprecated',
+                'versions', 'active_versions', 'unsupported_versions', '_columns', '_lifecycle')
+    
+    _RELEASE_COLUMNS = RELEASE_COLUMNS
+    _ACTIVE_COLUMNS = ACTIVE_COLUMNS
+    
+    def __init__(self, releases, active, featured, links=None):
+        for name, value in (('releases', tuple(map(tuple, releases))),
+                            ('active', tuple(map(tuple, active))),
+                            ('featured', featured),
+                            ('links', MappingProxyType(dict(links or {})))):
+            object.__setattr__(self, name, value)
+        with _timer('index'):
+            self._build_lookups()
+    
+    def _build_lookups(self) -> None:
+        """Precompute the hashed version lookups so membership and deprecation queries are O(1).
+
+        A release is deprecated when it is older than the oldest active branch,
+        matching the cut-off 'PyVersionTracker.is_deprecated' has always applied.
+        """
+        deprecated = self._classify({ver for ver, _ in self.releases})
+        records = tuple(PyVersion.from_row(ver, release_date, deprecated[ver])
+                        for ver, release_date in self.releases)
+        by_version = {}
+        for record in records:
+            by_version.setdefault(record.version, record)
+        object.__setattr__(self, 'records', records)
+        object.__setattr__(self, 'by_version', MappingProxyType(by_version))
+        object.__setattr__(self, 'deprecated', MappingProxyType(deprecated))
+        versions = VersionSequence(records)
+        object.__setattr__(self, 'versions', versions)
+        object.__setattr__(self, 'active_versions', VersionSequence(PyActive.from_row(*row) for row in self.active))
+        object.__setattr__(self, 'unsupported_versions',
+                            VersionSequence(record for record in versions if record.deprecated))
+        object.__setattr__(self, '_columns', None)
+        object.__setattr__(self, '_lifecycle', None)
+    
+    @property
+    def columns(self) -> ReleaseColumns:
+        """Columnar view of the releases for low-memory bulk filtering (built on first access)."""
+        if self._columns is None:
+            major, minor, micro = (array('H') for _ in range(3))
+            for record in self.records:
+                major.append(record.version_info[0])
+                minor.append(record.version_info[1])
+                micro.append(record.version_info[2] if len(record.version_info) > 2 else 0)
+            object.__setattr__(self, '_columns', ReleaseColumns(
+                tuple(record.version for record in self.records),
+                major, minor, micro,
+                array('i', (record.date.toordinal() if record.date else 0 for record in self.records)),
+                array('B', (record.deprecated for record in self.records))))
+        return self._columns
+    
+    @property
+    def lifecycle(self) -> LifecycleIndex:
+        """Date indexes for end-of-life, support and release date queries (built on first access)."""
+        if self._lifecycle is None:
+            object.__setattr__(self, '_lifecycle', LifecycleIndex(self.records, self.active_versions))
+        return self._lifecycle
+    
+    def _classify(self, __versions) -> dict:
+        """Classify the support status of every version in one sorted pass.
+
+        Versions are sorted once by their integer tuples and the oldest active branch
+        is located with a binary search; everything before it is deprecated.
+
+        Args:
+            __versions: Iterable of X.Y.Z version strings.
+
+        Returns:
+            dict: Mapping of version string to its deprecation flag.
+        """
+        ordered = sorted((PyVersionTracker.str2tuple(ver), ver) for ver in __versions)
+        if not self.active:
+            return {ver: False for _, ver in ordered}
+        boundary = PyVersionTracker.str2tuple(self.active[-1][0])
+        boundary += (0,) * (3 - len(boundary))
+        cut = bisect_left(ordered, (boundary,))
+        return {ver: idx < cut for idx, (_, ver) in enumerate(ordered)}
+    
+    def __setattr__(self, name, value) -> NoReturn:
+        raise AttributeError(f'{self.__class__.__name__!r} objects are immutable.')
+    
+    __delattr__ = __setattr__
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ReleaseIndex):
+            return NotImplemented
+        return (self.releases, self.active, self.featured) == \
+                (other.releases, other.active, other.featured)
+    
+    def __hash__(self) -> int:
+        return hash((self.releases, self.active, self.featured))
+    
+    def __repr__(self) -> str:
+        return (f'{self.__class__.__name__}(releases={len(self.releases)}, '
+                f'active={len(self.active)}, featured={self.featured!r})')
+    
+    def to_dict(self) -> dict:
+        """Serialize the index to JSON-compatible primitives (see 'from_dict')."""
+        return {'releases': [list(i) for i in self.releases],
+                'active': [list(i) for i in self.active],
+                'featured': self.featured,
+                'links': dict(self.links)}
+    
+    @classmethod
+    def from_dict(cls, __data) -> 'ReleaseIndex':
+        """Rebuild an index serialized with 'to_dict'.
+
+        Args:
+            __data: Mapping with 'releases', 'active' and 'featured' keys, and optionally
+                'links' (absent from snapshots written before release links were captured).
+
+        Returns:
+            ReleaseIndex: The restored index.
+
+        Raises:
+            PyVersionException: Raised if the data is not a serialized index.
+        """
+        try:
+            return cls(__data['releases'], __data['active'], __data['featured'], __data.get('links'))
+        except (KeyError, TypeError) as data_error:
+            raise PyVersionException(
+                'The provided data is not a serialized release index.'
+                ) from data_error
+    
+    @classmethod
+    def from_soup(cls, __soup) -> 'ReleaseIndex':
+        """Build the index from a parsed downloads page in one pass over the tree.
+
+        Args:
+            __soup: BeautifulSoup object of the downloads page.
+
+        Returns:
+            ReleaseIndex: The populated index.
+
+        Raises:
+            PyVersionException: Raised if the page has no featured download button.
+        """
+        return cls.from_columns(*columns_from_soup(__soup))
+    
+    @classmethod
+    def from_html(cls, __html: str, backend: Union[str, None]=None) -> 'ReleaseIndex':
+        """Build the index from downloads page HTML with a pluggable parser backend.
+
+        Args:
+            __html: HTML content of the downloads page.
+            backend: 'auto' (streaming extractor), 'stream', 'html.parser', 'strainer',
+                'lxml' or 'lxml-strainer' (default is 'PY_VERSION_TRACKER_PARSER' or 'auto').
+
+        Returns:
+            ReleaseIndex: The populated index.
+
+        Raises:
+            PyVersionException: Raised for unknown backends or pages without a featured download button.
+        """
+        with _timer('parse'):
+            columns, featured = extract_columns(__html, backend)
+        return cls.from_columns(columns, featured)
+    
+    @classmethod
+    def from_columns(cls, __columns, featured: Union[str, None]) -> 'ReleaseIndex':
+        """Build the index from per-class text columns, each still including its heading cell.
+
+        Args:
+            __columns: Mapping of CSS class name to the cleaned text of every matching element,
+                and optionally 'release-link' to the href of each release number link.
+            featured: Featured (latest stable) version.
+
+        Returns:
+            ReleaseIndex: The populated index.
+
+        Raises:
+            PyVersionException: Raised if the page has no featured download button.
+        """
+        if featured is None:
+            raise PyVersionException(
+                'Unable to locate the featured Python version on the downloads page.'
+                )
+        body = lambda __kind: __columns.get(__kind, [])[PyVersionTracker._default_slicer()]
+        versions = [i.split()[-1] for i in body('release-number')]
+        releases = zip(versions, body('release-date'))
+        links = {}
+        for ver, href in zip(versions, body(LINK_COLUMN)):
+            if href:
+                links.setdefault(ver, href)
+        active = zip(*map(body, cls._ACTIVE_COLUMNS))
+        return cls(releases, active, featured, links)
+
+
+class _querymethod(classmethod):
+    """A classmethod that binds to the instance when called on one.
+
+    Called on the class, a query uses a default-configured tracker; called on an
+    instance, it keeps that instance's offline, snapshot and cache settings.
+    """
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return super().__get__(instance, owner)
+        return self.__func__.__get__(instance, owner)
+
+
 class PyVersionTracker:
     _MAIN_PG = 'https://www.python.org/downloads'
+    _FULL_VERSION = re.compile(r'^\d+\.\d+\.\d+$')
+    _SHORT_VERSION = re.compile(r'^\d+\.\d+$')
     
-    def __init__(self):
-        pass
+    def __init__(self, *, offline=None, snapshot=None, cache_dir=None, cache_ttl=None):
+        """
+        Args:
+            offline: Serve every query from a release snapshot file without any network access
+                (default is the 'PY_VERSION_TRACKER_OFFLINE' environment variable).
+            snapshot: Snapshot file used in offline mode (default is 'PY_VERSION_TRACKER_SNAPSHOT',
+                then the snapshot written by 'refresh_snapshot').
+            cache_dir: Directory for the persistent release index snapshots, or False to
+                disable them (default is 'PY_VERSION_TRACKER_CACHE_DIR' or the user cache directory).
+            cache_ttl: Seconds a snapshot is served before it is revalidated with python.org
+                (default is 'PY_VERSION_TRACKER_CACHE_TTL' or 6 hours).
+        """
+        self._offline: bool = offline_enabled(offline)
+        self._snapshot = snapshot
+        self._cache_config = (cache_dir, cache_ttl)
+    
+    _PageResponse = namedtuple('_PageResponse', ('status', 'text', 'etag', 'last_modified'))
+    _PARSER: Union[str, None] = None
+    _SESSIONS = SessionPool(timeout=30, ssl=False, ttl_dns_cache=300)
+    _INDEXES: Dict[Tuple[str, Union[SnapshotCache, None]], ReleaseIndex] = {}
+    # Concurrent threads missing the same cache entry share one load (see 'shared').
+    _FLIGHTS = SingleFlight()
+    _SHARED: Union['PyVersionTracker', None] = None
+    _SHARED_LOCK = threading.Lock()
     
     @classmethod
-    def _compiler(cls,
-                __defaults, __k,
-                *,
-                escape_default=True,
-                escape_k=True,
-                search=True) -> Match:
-        """
-        ### Validate if the given input matches the provided defaults.
+    async def _fetch_page(cls, __url: str='', headers=None) -> Union[Coroutine[Any, Any, '_PageResponse'], NoReturn]:
+        """Make an asynchronous HTTP request and keep the response's cache validators.
+        
+        The request goes through the running loop's pooled session, and concurrent
+        requests for the same URL and headers share a single in-flight fetch.
         
         Args:
-            __defaults: Default values to match against (may contain regex patterns).
-            __k: Input to validate.
-            escape_k: Whether to escape special characters in the input (default is True).
-            search: If True, perform a search; if False, perform a match (default is True).
+            __url: URL for the HTTP request.
+            headers: Extra request headers (e.g. If-None-Match / If-Modified-Since).
         
         Returns:
-            bool: True if the input matches any default, False otherwise.
-        """
-        if any((not __k,
-                not isinstance(__k, str),
-                hasattr(__k, '__str__'))):
-            esc_k = str(__k)
+            Union[Coroutine[Any, Any, _PageResponse], NoReturn]: Status, body, ETag and Last-Modified.
         
-        defaults = map(re.escape, map(str, __defaults))
-        flag = '|' if escape_default else ''
-        pattern = f'{flag}'.join(defaults)
-        if escape_k:
-            esc_k = '|'.join(map(re.escape, __k))
+        Raises:
+            PyVersionException: Raised if the HTTP request fails.
+        """
+        url_link = __url or cls._MAIN_PG
+        headers = dict(headers or {})
+        return await cls._SESSIONS.coalesce(('page', url_link, tuple(sorted(headers.items()))),
+                                            lambda: cls._get_page(url_link, headers))
+    
+    @classmethod
+    async def _get_page(cls, __url: str, __headers) -> Union[Coroutine[Any, Any, '_PageResponse'], NoReturn]:
+        import asyncio
+        from aiohttp import ClientError
         
-        compiler = re.compile(pattern, re.IGNORECASE)
-        if not search:
-            compiled = compiler.match(esc_k)
-        else:
-            compiled = compiler.search(esc_k)
-        return compiled
+        try:
+            with _timer('fetch'):
+                session = await cls._SESSIONS.session()
+                async with session.get(__url, headers=__headers) as response:
+                    body = await response.read()
+                    _count('http.requests')
+                    _count('http.bytes', len(body))
+                    if response.status == 304:
+                        _count('http.not_modified')
+                    return cls._PageResponse(response.status,
+                                            body.decode(response.get_encoding()),
+                                            response.headers.get('ETag'),
+                                            response.headers.get('Last-Modified'))
+        # Any transport failure (connection, status, truncated body, invalid URL, timeout).
+        except (ClientError, asyncio.TimeoutError) as response_errors:
+            _count('http.errors')
+            raise PyVersionException(
+                f'Failed trying to extract: {__url}'
+            ) from response_errors
     
     @classmethod
-    @cache
     async def _request_py(cls, __url: str='') -> Union[Coroutine[Any, Any, str], NoReturn]:
         """Make an asynchronous HTTP request to a specified URL.
         
@@ -79,47 +661,391 @@ class PyVersionTracker:
         Raises:
             PyVersionException: Raised if the HTTP request fails.
         """
-        url_link = __url or cls._MAIN_PG
-        try:
-            async with ClientSession(connector=TCPConnector(ssl=False,
-                                                            ttl_dns_cache=300,
-                                                            force_close=True,
-                                                            enable_cleanup_closed=True),
-                                    raise_for_status=True) as session:
-                async with session.get(url_link) as response:
-                    return await response.text()
-        except (ServerDisconnectedError, ClientResponseError,
-                ServerConnectionError, ClientConnectionError) as response_errors:
-            raise PyVersionException(
-                f'Failed trying to extract: {url_link}'
-            ) from response_errors
+        return (await cls._fetch_page(__url)).text
     
     @classmethod
     def _parse_py(cls, __soup, attr='find_all', **kwargs) -> Any:
         return getattr(__soup, attr)(**kwargs)
     
     @classmethod
-    @cache
-    def _soupify(cls, __url='') -> BeautifulSoup:
+    def _soupify(cls, __url='') -> 'BeautifulSoup':
         """Parse HTML content using BeautifulSoup.
 
         Args:
-            __soup: BeautifulSoup object containing HTML content.
-            attr (str): Attribute to use for parsing (default is 'find_all').
-            **kwargs: Additional keyword arguments for BeautifulSoup.
+            __url: URL of the page to fetch and parse (default is the official downloads page).
+
+        Returns:
+            BeautifulSoup: The page's tree, cached per URL.
+
+        Raises:
+            PyVersionException: Raised if the page cannot be fetched.
+        """
+        stats = active_stats()
+        if stats is None:
+            return cls._soup_cache(__url)
+        misses = cls._soup_cache.cache_info().misses
+        soup = cls._soup_cache(__url)
+        stats.count('cache.soup.miss' if cls._soup_cache.cache_info().misses > misses else 'cache.soup.hit')
+        return soup
+    
+    @classmethod
+    @cache
+    def _soup_cache(cls, __url='') -> 'BeautifulSoup':
+        return cls._FLIGHTS.do(('soup', __url),
+                            lambda: cls._make_soup(run_sync(PyVersionTracker._request_py(__url))))
+    
+    @classmethod
+    def _make_soup(cls, __html: str) -> 'BeautifulSoup':
+        from bs4 import BeautifulSoup
+        
+        with _timer('soup'):
+            return BeautifulSoup(__html, 'html.parser')
+    
+    @classmethod
+    def _parse_index(cls, __html: str) -> ReleaseIndex:
+        return ReleaseIndex.from_html(__html, cls._PARSER)
+    
+    def _release_index(self, __url='') -> ReleaseIndex:
+        """Get the release index for a downloads page, walking its tree at most once.
+
+        Args:
+            __url: URL of the downloads page (default is the official page).
 
         Returns:
-            Any: Result of the parsing operation.
+            ReleaseIndex: Index every public property and classmethod is served from.
+
+        Raises:
+            PyVersionException: Raised if the page cannot be fetched or indexed.
+        """
+        if self._offline:
+            return self._load_snapshot(self._snapshot)
+        return self._load_index(__url or self._MAIN_PG, SnapshotCache.from_config(*self._cache_config))
+    
+    @classmethod
+    def shared(cls, preload: bool=True) -> 'PyVersionTracker':
+        """
+        ### Get the process-wide tracker, for multi-threaded servers.
+        
+        The first call creates it and (with 'preload') loads its release index while
+        holding a lock, so concurrent first requests wait for one fetch and parse
+        instead of each starting their own. Later calls take no lock and every query
+        reads the immutable 'ReleaseIndex'; 'reload' swaps in a new index atomically.
+        
+        Args:
+            preload: Load the release index before returning (default is True).
+        
+        Returns:
+            PyVersionTracker: The same instance for every caller (configured from the environment).
+        
+        Raises:
+            PyVersionException: Raised if the first load fails (the next call retries it).
+        """
+        if (tracker := cls._SHARED) is None:
+            with cls._SHARED_LOCK:
+                if (tracker := cls._SHARED) is None:
+                    tracker = cls()
+                    if preload:
+                        tracker._release_index()
+                    cls._SHARED = tracker
+        return tracker
+    
+    async def afetch(self, __url='') -> ReleaseIndex:
+        """Load the release index without blocking the running event loop.
+
+        Uses the loop's pooled session, and concurrent calls for the same page share one
+        fetch. Once awaited, every property and classmethod of trackers with the same
+        configuration is served from memory.
+
+        Args:
+            __url: URL of the downloads page (default is the official page).
+
+        Returns:
+            ReleaseIndex: The release index.
+
+        Raises:
+            PyVersionException: Raised if the page cannot be fetched or indexed.
+        """
+        if self._offline:
+            return self._release_index()
+        return await self._aload_index(__url or self._MAIN_PG, SnapshotCache.from_config(*self._cache_config))
+    
+    async def areload(self, __url='') -> ReleaseIndex:
+        """Revalidate the release index with python.org now and replace the in-memory copy.
+
+        Unlike 'afetch', fresh snapshots are not trusted and fetch errors are not masked
+        by a stale snapshot. With the snapshot cache enabled the request is conditional,
+        so an unchanged page costs a 304 and no parsing.
+
+        Args:
+            __url: URL of the downloads page (default is the official page).
+
+        Returns:
+            ReleaseIndex: The reloaded release index.
+
+        Raises:
+            PyVersionException: Raised in offline mode or if the page cannot be fetched or indexed.
+        """
+        import asyncio
+        
+        if self._offline:
+            raise PyVersionException('The release index cannot be reloaded while offline mode is enabled.')
+        url: str = __url or self._MAIN_PG
+        snapshot_cache = SnapshotCache.from_config(*self._cache_config)
+        if snapshot_cache is None:
+            response = await self._fetch_page(url)
+            index = await asyncio.get_running_loop().run_in_executor(None, self._parse_index, response.text)
+        else:
+            entry = await self._arevalidate(url, snapshot_cache, force=True)
+            index = ReleaseIndex.from_dict(entry.payload)
+        self._INDEXES[(url, snapshot_cache)] = index
+        return index
+    
+    def reload(self, __url='') -> ReleaseIndex:
+        """Synchronous counterpart of 'areload'."""
+        return run_sync(self.areload(__url))
+    
+    @staticmethod
+    def instrument(callback=None, enabled: bool=True) -> Union[TrackerStats, None]:
+        """Enable (or disable) recording of stage timings, cache hits and HTTP counters.
+
+        Instrumentation is off by default; while off, each hook costs one attribute check.
+
+        Args:
+            callback: Optional callable receiving every measurement as a 'StatsEvent'.
+            enabled: False disables instrumentation and returns the stats that were recorded.
+
+        Returns:
+            Union[TrackerStats, None]: The stats being recorded into (or, when disabling, the previous ones).
 
         Raises:
             None
         """
-        html_contents = asyncio.run(PyVersionTracker._request_py(__url))
-        return BeautifulSoup(html_contents, 'html.parser')
+        return enable_instrumentation(callback=callback) if enabled else disable_instrumentation()
+    
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the pooled HTTP session of the running event loop."""
+        await cls._SESSIONS.close()
+    
+    @classmethod
+    def _load_snapshot(cls, __snapshot=None) -> Union[ReleaseIndex, NoReturn]:
+        """Load the release index from a snapshot file for offline mode.
+
+        Parsed snapshots are cached per file version (inode, mtime and size), so a
+        snapshot republished by 'ReleaseRefresher' or 'refresh_snapshot' is picked
+        up by the next query at the cost of one 'stat' call.
+
+        Args:
+            __snapshot: Explicit snapshot path, or None to search the default locations.
+
+        Returns:
+            Union[ReleaseIndex, NoReturn]: The release index stored in the snapshot.
+
+        Raises:
+            PyVersionException: Raised if no readable snapshot exists.
+        """
+        __path = find_snapshot(__snapshot)
+        if __path is None:
+            raise PyVersionException(
+                'Offline mode is enabled but no release snapshot was found.\n'
+                "Generate one with 'python -m py_version_tracker snapshot' while online "
+                "or point 'PY_VERSION_TRACKER_SNAPSHOT' at an existing snapshot file."
+                )
+        try:
+            stat = __path.stat()
+        except OSError as snapshot_error:
+            raise PyVersionException(
+                f'Unable to read the release snapshot: {str(__path)!r}'
+                ) from snapshot_error
+        return cls._snapshot_cache(str(__path), stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _snapshot_cache(cls, __path: str, *__version: int) -> ReleaseIndex:
+        return cls._FLIGHTS.do(('snapshot', __path, *__version), lambda: cls._read_snapshot(Path(__path)))
+    
+    @classmethod
+    def _read_snapshot(cls, __path: Path) -> Union[ReleaseIndex, NoReturn]:
+        import json
+        
+        if __path.suffix.lower() in ('.jsonl', '.ndjson', '.csv', '.pvti'):
+            from .export import import_index
+            
+            return import_index(__path)
+        try:
+            with open(__path, encoding='utf-8') as snapshot:
+                return ReleaseIndex.from_dict(json.load(snapshot))
+        except (OSError, ValueError) as snapshot_error:
+            raise PyVersionException(
+                f'Unable to read the release snapshot: {str(__path)!r}'
+                ) from snapshot_error
+    
+    def export_index(self, __path, format: Union[str, None]=None, url: str='') -> Path:
+        """Export the release index for downstream jobs, or as an offline snapshot for other workers.
+
+        Releases are written with integer version columns, parsed dates, deprecation,
+        branch status, end-of-life dates and release page links, alongside the active branches.
+
+        Args:
+            __path: Destination file, replaced atomically.
+            format: 'jsonl', 'csv' or 'binary' (default is inferred from the extension:
+                '.jsonl'/'.ndjson', '.csv' or '.pvti').
+            url: URL of the downloads page (default is the official page).
+
+        Returns:
+            Path: Path of the written file.
+
+        Raises:
+            PyVersionException: Raised for an unknown format or if the page cannot be fetched or indexed.
+        """
+        from .export import export_index
+        
+        return export_index(self._release_index(url), __path, format)
+    
+    @classmethod
+    def refresh_snapshot(cls, __path=None, url: str='') -> Path:
+        """Fetch the downloads page and write a release snapshot for offline mode.
+
+        Args:
+            __path: Destination file (default is the user cache directory's 'releases.json').
+            url: URL of the downloads page (default is the official page).
+
+        Returns:
+            Path: Path of the written snapshot.
+
+        Raises:
+            PyVersionException: Raised if the page cannot be fetched or indexed.
+        """
+        page_url: str = url or cls._MAIN_PG
+        index: ReleaseIndex = cls._parse_index(run_sync(cls._request_py(page_url)))
+        snapshot = {'url': page_url, 'generated_at': time.time(), **index.to_dict()}
+        return atomic_write_json(__path or default_snapshot_path(), snapshot)
+    
+    @classmethod
+    def _load_index(cls, __url: str, __cache: Union[SnapshotCache, None]=None) -> ReleaseIndex:
+        """Get the in-memory release index, loading it on the shared I/O loop on first use.
+
+        Threads that miss the in-memory index at the same time wait for one load; once
+        it is stored, reads take no lock.
+
+        Args:
+            __url: URL of the downloads page.
+            __cache: Snapshot cache to use, or None to always fetch and parse the page.
+
+        Returns:
+            ReleaseIndex: The release index.
+
+        Raises:
+            PyVersionException: Raised if the page cannot be fetched and no snapshot exists.
+        """
+        index = cls._INDEXES.get((__url, __cache))
+        if index is None:
+            index = cls._FLIGHTS.do(('index', __url, __cache),
+                                    lambda: run_sync(cls._aload_index(__url, __cache)))
+        else:
+            _count('cache.index.hit')
+        return index
+    
+    @classmethod
+    async def _aload_index(cls, __url: str, __cache: Union[SnapshotCache, None]=None) -> ReleaseIndex:
+        """Load the release index from the snapshot cache, revalidating it with python.org once stale.
+
+        A fresh snapshot is served without any network access or HTML parsing. A stale one
+        is revalidated with If-None-Match / If-Modified-Since under the cache's file lock,
+        so a 304 only refreshes its timestamp and concurrent processes fetch the page once.
+        Concurrent loads of the same index on one event loop share a single in-flight load.
+
+        Args:
+            __url: URL of the downloads page.
+            __cache: Snapshot cache to use, or None to always fetch and parse the page.
+
+        Returns:
+            ReleaseIndex: The release index.
+
+        Raises:
+            PyVersionException: Raised if the page cannot be fetched and no snapshot exists.
+        """
+        key = (__url, __cache)
+        if (index := cls._INDEXES.get(key)) is not None:
+            _count('cache.index.hit')
+            return index
+        _count('cache.index.miss')
+        
+        async def _load() -> ReleaseIndex:
+            import asyncio
+            
+            loop = asyncio.get_running_loop()
+            if __cache is None:
+                response = await cls._fetch_page(__url)
+                index = await loop.run_in_executor(None, cls._parse_index, response.text)
+            else:
+                entry = await loop.run_in_executor(None, __cache.load, __url)
+                _count('cache.snapshot.miss' if entry is None else
+                        'cache.snapshot.hit' if __cache.is_fresh(entry) else 'cache.snapshot.stale')
+                if entry is None or not __cache.is_fresh(entry):
+                    entry = await cls._arevalidate(__url, __cache)
+                index = ReleaseIndex.from_dict(entry.payload)
+            return cls._INDEXES.setdefault(key, index)
+        
+        return await cls._SESSIONS.coalesce(('index', *key), _load)
+    
+    @classmethod
+    async def _arevalidate(cls, __url: str, __cache: SnapshotCache, force: bool=False) -> CacheEntry:
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        lock = __cache.lock(__url)
+        try:
+            await loop.run_in_executor(None, lock.__enter__)
+        except OSError:
+            # An unusable cache directory (read-only home, a file in its place) must not
+            # break queries: fetch and parse the page as if the cache were disabled.
+            _count('cache.snapshot.error')
+            response = await cls._fetch_page(__url)
+            index = await loop.run_in_executor(None, cls._parse_index, response.text)
+            return CacheEntry(__url, time.time(), response.etag, response.last_modified, index.to_dict())
+        try:
+            # Another process may have refreshed the snapshot while we waited for the lock.
+            entry = __cache.load(__url)
+            if entry is not None and __cache.is_fresh(entry) and not force:
+                return entry
+            
+            headers = {}
+            if entry is not None:
+                if entry.etag:
+                    headers['If-None-Match'] = entry.etag
+                if entry.last_modified:
+                    headers['If-Modified-Since'] = entry.last_modified
+            try:
+                response = await cls._fetch_page(__url, headers)
+            except PyVersionException:
+                if entry is None or force:
+                    raise
+                # Serve the stale snapshot rather than failing while python.org is unreachable.
+                return entry
+            
+            if response.status == 304 and entry is not None:
+                payload = entry.payload
+            else:
+                index = await loop.run_in_executor(None, cls._parse_index, response.text)
+                payload = index.to_dict()
+            entry = CacheEntry(__url, time.time(),
+                                response.etag or (entry and entry.etag),
+                                response.last_modified or (entry and entry.last_modified),
+                                payload)
+            try:
+                __cache.store(entry)
+            except OSError:
+                _count('cache.snapshot.error')
+            return entry
+        finally:
+            lock.__exit__(None, None, None)
     
     def _clean_page(self, **kwargs) -> List[str]:
         url = kwargs.pop('url', '')
-        return [i.get_text(strip=True) for i in self._parse_py(self._soupify(url), **kwargs)]
+        soup = self._soupify(url)
+        with _timer('clean_page'):
+            return [i.get_text(strip=True) for i in self._parse_py(soup, **kwargs)]
     
     def _parse_mp(self, **kwargs) -> List[str]:
         return self._clean_page(name=kwargs.pop('name', 'span'), **kwargs)
@@ -128,76 +1054,47 @@ class PyVersionTracker:
     def _default_slicer(__start=1) -> slice:
         return slice(__start, *[None]*2)
     
-    @cached_property
+    @_querymethod
+    def _tracker(cls) -> 'PyVersionTracker':
+        return cls if isinstance(cls, PyVersionTracker) else cls()
+    
+    @property
     def max_stable_version(self) -> NamedTuple:
-        version_html: List[str] = self._parse_mp(name='p', class_='download-buttons', attr='find')
-        max_version: str = version_html[1].split()[-1]
-        return next(ver for ver in self.all_versions
-                    if ver.version==max_version)
+        index: ReleaseIndex = self._release_index()
+        if index.featured not in index.by_version:
+            self._base_error()
+        return index.by_version[index.featured]
     
-    @cached_property
+    @property
     def min_stable_version(self) -> NamedTuple:
-        return min(self.active_versions,
-                key=lambda _x: self.str2tuple(_x.version))
-    
-    def _base_pytuple(self, __data, with_deprecation=False):
-        """Create base namedtuple for PyVersion.
-
-        Args:
-            __data: Data to populate the namedtuple.
-            with_deprecation (bool): Flag to include deprecation information (default is False).
-
-        Returns:
-            Generator: Generator of namedtuples.
-
-        Raises:
-            None
-        """
-        py_version = namedtuple('PyVersion',
-                            ('version', 'release_date', 'deprecated'),
-                            defaults=[None]*3)
-        return (py_version(i[0], i[1], self.is_deprecated(i[0])) for i in __data) \
-                if with_deprecation else (py_version(*i) for i in __data)
+        return self.active_versions[0]
     
-    @cached_property
-    def all_versions(self) -> Generator[NamedTuple, None, None]:
+    @property
+    def all_versions(self) -> 'VersionSequence':
         """Get all stable versions with deprecation information.
 
         Returns:
-            Generator: Generator of namedtuples.
+            VersionSequence: Re-iterable view of 'PyVersion' records, sorted by version.
 
         Raises:
             None
         """
-        return self._base_pytuple(self._get_all_versions(), with_deprecation=True)
+        return self._release_index().versions
     
-    def _get_all_versions(self) -> Generator[NamedTuple, None, None]:
-        get_contents = lambda __kind: self._parse_mp(class_=__kind)[self._default_slicer()]
-        stable_versions = zip([i.split()[-1] for i in get_contents('release-number')],
-                            get_contents('release-date'))
-        return self._base_pytuple(stable_versions)
+    def _get_all_versions(self) -> 'VersionSequence':
+        return self._release_index().versions
     
-    @cached_property
-    def active_versions(self) -> Generator[NamedTuple, None, None]:
+    @property
+    def active_versions(self) -> 'VersionSequence':
         """Get active versions with status information.
 
         Returns:
-            Generator: Generator of namedtuples.
+            VersionSequence: Re-iterable view of 'PyActive' records, sorted by version.
 
         Raises:
             None
         """
-        active_tuple = namedtuple('PyActive', ('version', 'status',
-                                                'start', 'end', 'schedule'))
-        get_contents = lambda __kind: self._parse_mp(class_=__kind)[self._default_slicer()]
-        active_versions = zip(
-                            get_contents('release-version'),
-                            get_contents('release-status'),
-                            get_contents('release-start'),
-                            get_contents('release-end'),
-                            get_contents('release-pep')
-                            )
-        return (active_tuple(*i) for i in active_versions)
+        return self._release_index().active_versions
     
     @classmethod
     def _base_error(cls) -> NoReturn:
@@ -211,7 +1108,7 @@ class PyVersionTracker:
                     "Please ensure that the provided version is included in the 'all_versions' range."
                     ) from None
     
-    @classmethod
+    @_querymethod
     def _validate_version(cls, __version: str) -> Union[str, NoReturn]:
         """Validate and format a given version string.
 
@@ -224,14 +1121,14 @@ class PyVersionTracker:
         Raises:
             PyVersionException: Raised for invalid version formats.
         """
-        compiler = lambda __pat: re.compile(__pat).match(__version)
-        if compiler(r'^\d+\.\d+\.\d+$'):
+        if cls._FULL_VERSION.match(__version):
             version: str = __version
-        elif compiler(r'^\d+\.\d+$'):
+        elif cls._SHORT_VERSION.match(__version):
             if cls.is_version(version:=(__version + '.0')):
                 pass
-        elif len(cls.str2tuple(__version))==3:
-            pass
+        elif len(parts := cls.str2tuple(__version))==3:
+            # Padded forms such as ' 3.8.1' are normalized to '3.8.1'.
+            version: str = '.'.join(map(str, parts))
         else:
             raise PyVersionException(
                 f'Invalid version format: {__version!r}.\n'
@@ -239,7 +1136,7 @@ class PyVersionTracker:
                 )
         return version
     
-    @classmethod
+    @_querymethod
     def is_version(cls, __version: str) -> Union[bool, NoReturn]:
         """Check if a version is in the accepted range of Python versions.
 
@@ -252,19 +1149,13 @@ class PyVersionTracker:
         Raises:
             PyVersionException: Raised for invalid versions.
         """
-        all_versions: Generator[str, None, None] = cls._unpack_versions(cls()._get_all_versions())
         if org_version:=(cls._validate_version(__version)):
-            ver_compiled = cls._compiler(all_versions,
-                                        org_version,
-                                        escape_k=False,
-                                        search=False)
-            if ver_compiled:
-                found_version = ver_compiled.group(0)
-                return found_version == org_version
+            if org_version in cls._tracker()._release_index().by_version:
+                return True
         
         cls._base_error()
     
-    @classmethod
+    @_querymethod
     def is_deprecated(cls, __version: str) -> Union[bool, NoReturn]:
         """Check if a version is deprecated.
 
@@ -279,27 +1170,195 @@ class PyVersionTracker:
         """
         version: str = cls._validate_version(__version)
         if version:
-            unsupported: Generator[str, None, None] = cls._unpack_versions(cls._unsupported_v())
-            all_v: Generator[str, None, None] = cls._unpack_versions(cls._unsupported_v(True))
-            if version not in all_v:
+            deprecated = cls._tracker()._release_index().deprecated
+            if version not in deprecated:
                 cls._base_error()
             else:
-                return version in unsupported
+                return deprecated[version]
+    
+    @_querymethod
+    def classify_versions(cls, __versions) -> Generator[NamedTuple, None, None]:
+        """Classify the support status of many versions against one release index snapshot.
+
+        Deprecation for every release is computed up front in a single sorted pass,
+        so each version costs one validation and one hashed lookup.
+
+        Args:
+            __versions: Iterable of version strings (X.Y.Z or X.Y).
+
+        Returns:
+            Generator: Generator of PyVersion namedtuples with deprecation information.
+
+        Raises:
+            PyVersionException: Raised for invalid versions.
+        """
+        index: ReleaseIndex = cls._tracker()._release_index()
+        
+        def _records():
+            for ver in __versions:
+                version: str = cls._validate_version(ver)
+                if version not in index.by_version:
+                    cls._base_error()
+                yield index.by_version[version]
+        
+        return _records()
+    
+    _DETAILS: Dict[str, Tuple[NamedTuple, ...]] = {}
+    
+    @classmethod
+    def _release_url(cls, __version: str, __index: Union[ReleaseIndex, None]=None) -> str:
+        # Follow the page's own release link; build the usual path only for versions without one.
+        href = __index.links.get(__version) if __index is not None else None
+        return urljoin(cls._MAIN_PG, href or f"/downloads/release/python-{__version.replace('.', '')}/")
     
     @classmethod
-    def _unpack_versions(cls, __gen) -> Generator[str, None, None]:
-        """Unpack versions from a generator.
+    def _parse_release_files(cls, __html: str) -> Tuple[NamedTuple, ...]:
+        """Extract the artifact table of a release page.
 
         Args:
-            __gen: Generator containing versions.
+            __html: HTML content of a release page.
 
         Returns:
-            Generator: Generator of version strings.
+            Tuple: Tuple of PyFile namedtuples, one per downloadable file.
 
         Raises:
             None
         """
-        return (ver.version for ver in __gen)
+        links = lambda __cells: tuple(a['href'] for cell in __cells
+                                        for a in cell.find_all('a', href=True))
+        files = []
+        for table in cls._parse_py(cls._make_soup(__html), name='table'):
+            headers: List[str] = []
+            for th in table.find_all('th'):
+                headers += [th.get_text(strip=True).lower()] * int(th.get('colspan', 1))
+            if 'md5 sum' not in headers:
+                continue
+            for row in table.find_all('tr'):
+                columns: Dict[str, list] = {}
+                for header, cell in zip(headers, row.find_all('td')):
+                    columns.setdefault(header, []).append(cell)
+                if not columns:
+                    continue
+                text = lambda __header: (columns[__header][0].get_text(strip=True) or None) \
+                                        if __header in columns else None
+                size: str = text('file size') or ''
+                files.append(PyFile(name=text('version'),
+                                        url=next(iter(links(columns.get('version', ()))), None),
+                                        operating_system=text('operating system'),
+                                        description=text('description'),
+                                        md5=text('md5 sum'),
+                                        size=int(size) if size.isdigit() else None,
+                                        signature=next(iter(links(columns.get('gpg', ()))), None),
+                                        sigstore=links(columns.get('sigstore', ()))))
+        return tuple(files)
+    
+    @classmethod
+    async def _afetch_release_files(cls, __url: str, semaphore,
+                                    retries: int, backoff: float,
+                                    __cache: Union[SnapshotCache, None],
+                                    offline: bool=False) -> Tuple[NamedTuple, ...]:
+        import asyncio
+        from aiohttp import ClientResponseError
+        
+        if (files := cls._DETAILS.get(__url)) is not None:
+            return files
+        loop = asyncio.get_running_loop()
+        # Published release pages do not change, so a stored copy never needs revalidating.
+        entry = __cache and await loop.run_in_executor(None, __cache.load, __url)
+        if entry:
+            files = tuple(PyFile(*i[:-1], tuple(i[-1])) for i in entry.payload['files'])
+            return cls._DETAILS.setdefault(__url, files)
+        if offline:
+            raise PyVersionException(
+                f'The release page {__url!r} is not cached and offline mode is enabled.'
+                )
+        
+        for attempt in range(retries + 1):
+            try:
+                async with semaphore:
+                    html_contents: str = await cls._request_py(__url)
+                break
+            except PyVersionException as request_error:
+                cause = request_error.__cause__
+                client_error = isinstance(cause, ClientResponseError) and 400 <= cause.status < 500
+                if client_error or attempt == retries:
+                    raise
+                await asyncio.sleep(backoff * 2 ** attempt)
+        
+        files = await loop.run_in_executor(None, cls._parse_release_files, html_contents)
+        if __cache:
+            entry = CacheEntry(__url, time.time(), None, None, {'files': [list(i) for i in files]})
+            try:
+                await loop.run_in_executor(None, __cache.store, entry)
+            except OSError:
+                _count('cache.snapshot.error')
+        return cls._DETAILS.setdefault(__url, files)
+    
+    @_querymethod
+    async def aenrich_versions(cls, __versions=None, *,
+                                concurrency: int=10,
+                                retries: int=3,
+                                backoff: float=0.5) -> List[NamedTuple]:
+        """Fetch the release pages of many versions concurrently and attach their artifacts.
+
+        Release pages are fetched through the pooled session with at most 'concurrency'
+        requests in flight, retried with exponential backoff on connection and server
+        errors, and cached per page (in memory and in the snapshot cache, if enabled).
+        A page that cannot be fetched does not abort the batch: its releases are returned
+        without files and with the failure in their 'error' field.
+
+        Args:
+            __versions: Iterable of version strings (default is every stable release).
+            concurrency: Maximum number of release pages fetched at once (default is 10).
+            retries: Retries per page after a failed request (default is 3).
+            backoff: Initial delay in seconds between retries, doubled each time (default is 0.5).
+
+        Returns:
+            List: PyRelease namedtuples with the release page URL, its files, the
+                release schedule (PEP) of the version's branch if it is still active and
+                the error the page failed with (None on success).
+
+        Raises:
+            PyVersionException: Raised for invalid versions.
+        """
+        import asyncio
+        
+        tracker = cls._tracker()
+        index: ReleaseIndex = await tracker.afetch()
+        if __versions is None:
+            __versions = (ver for ver, _ in index.releases)
+        records = list(tracker.classify_versions(__versions))
+        schedules = {row[0]: row[-1] for row in index.active}
+        semaphore = asyncio.Semaphore(concurrency)
+        snapshot_cache = SnapshotCache.from_config(*tracker._cache_config)
+        urls = [cls._release_url(record.version, index) for record in records]
+        unique_urls = list(dict.fromkeys(urls))
+        results = await asyncio.gather(*(cls._afetch_release_files(url, semaphore, retries, backoff,
+                                                                    snapshot_cache, tracker._offline)
+                                        for url in unique_urls),
+                                        return_exceptions=True)
+        results_by_url = dict(zip(unique_urls, results))
+        releases = []
+        for record, url in zip(records, urls):
+            result = results_by_url[url]
+            schedule = schedules.get('.'.join(record.version.split('.')[:2]))
+            if isinstance(result, PyVersionException):
+                error = f'{result} ({result.__cause__})' if result.__cause__ else str(result)
+                releases.append(PyRelease(*record, url, (), schedule, error))
+            elif isinstance(result, Exception):
+                # Anything else that failed one page (e.g. a bad cache entry) is reported too.
+                releases.append(PyRelease(*record, url, (), schedule,
+                                        f'Failed trying to extract: {url} ({result!r})'))
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                releases.append(PyRelease(*record, url, result, schedule))
+        return releases
+    
+    @_querymethod
+    def enrich_versions(cls, __versions=None, **kwargs) -> List[NamedTuple]:
+        """Synchronous counterpart of 'aenrich_versions' (accepts the same arguments)."""
+        return run_sync(cls.aenrich_versions(__versions, **kwargs))
     
     @classmethod
     def _convert_tuple(cls, __version: str, tuple2str=False) -> Union[Tuple[int, ...], str]:
@@ -346,53 +1405,172 @@ class PyVersionTracker:
     def tuple2str(cls, __version: str):
         return cls._convert_tuple(__version, tuple2str=True)
     
-    @classmethod
-    def version_range(cls, __version: str=None, above=False):
+    # Bulk parsing and comparison (see 'versions').
+    parse_versions = staticmethod(parse_versions)
+    compare_many = staticmethod(compare_many)
+    satisfies_minimum = staticmethod(satisfies_minimum)
+    
+    @_querymethod
+    def version_range(cls, __version: str=None, __upper: str=None, above=False, inclusive=True) -> 'VersionSequence':
         """Get versions within a specified range.
 
+        With one bound, returns the releases up to (or, with 'above', from) that version.
+        With two bounds, returns the releases between them; an X.Y upper bound covers
+        its whole minor series, so ('3.8', '3.11') ends at the last 3.11 patch. Both
+        forms bisect the sorted release index, so a query costs O(log n + k).
+
         Args:
-            __version: Target version for the range (default is minimum stable version).
+            __version: Target version, or the lower bound when '__upper' is given
+                (default is minimum stable version, or unbounded in the two-bound form).
+            __upper: Upper bound version (default is None for a one-sided range).
             above: Flag to get versions above the target version (default is False).
+            inclusive: Whether versions equal to a bound are included (default is True).
 
         Returns:
-            Generator: Generator of version strings.
+            VersionSequence: Matching 'PyVersion' records, sorted by version.
 
         Raises:
-            None
+            PyVersionException: Raised for invalid or unknown versions.
         """
+        if isinstance(__upper, bool):
+            # Pre-range call signature: version_range(version, above).
+            __upper, above = None, __upper
+        tracker = cls._tracker()
+        versions = tracker._release_index().versions
+        if __upper is not None:
+            lower = cls._validate_version(__version) if __version else None
+            upper: str = cls._validate_version(__upper)
+            if cls._SHORT_VERSION.match(__upper):
+                upper = upper.rsplit('.', 1)[0]
+            return versions.between(lower, upper, inclusive=inclusive)
         if not __version:
-            __version: str = cls().min_stable_version.version
+            __version: str = tracker.min_stable_version.version
         version: str = cls._validate_version(__version)
-        target_version: Tuple[int, ...] = cls.str2tuple(version)
-        _operator = operator.ge if above else operator.le
-        return (ver for ver in cls().all_versions
-                if _operator(cls.str2tuple(ver.version), target_version))
-    
-    @classmethod
-    def _unsupported_v(cls, __all=False) -> Union[Iterator[NamedTuple],
-                                            Generator[NamedTuple, None, None]]:
-        all_versions: Tuple[tee, ...] = tee(cls()._get_all_versions())
-        if __all:
-            return all_versions[0]
-        active_versions: List[str] = [i.version for i in cls().active_versions]
-        last_active: str = cls._validate_version(active_versions.pop())
-        versions: List[str] = sorted(cls._unpack_versions(all_versions[0]), key=cls.str2tuple)
-        unsupported_v: List[str] = versions[:versions.index(last_active)]
-        return (i for i in all_versions[1]
-                if i.version in unsupported_v)
-    
-    @cached_property
-    def unsupported_versions(self) -> Union[Iterator[NamedTuple],
-                                    Generator[NamedTuple, None, None]]:
+        if above:
+            return versions.between(lo=version, inclusive=inclusive)
+        return versions.between(hi=version, inclusive=inclusive)
+    
+    @_querymethod
+    def release_series(cls, __series: str) -> 'VersionSequence':
+        """Get every patch release of a minor series.
+
+        Args:
+            __series: Minor series in the format X.Y (e.g. '3.10').
+
+        Returns:
+            VersionSequence: The series' 'PyVersion' records, sorted by version.
+
+        Raises:
+            PyVersionException: Raised for invalid version formats.
+        """
+        return cls._tracker()._release_index().versions.series(__series)
+    
+    @_querymethod
+    def latest_patches(cls) -> 'VersionSequence':
+        """Get the latest patch release of each minor series.
+
+        Returns:
+            VersionSequence: One 'PyVersion' record per minor series, sorted by version.
+
+        Raises:
+            None
+        """
+        return cls._tracker()._release_index().versions.latest_patches()
+    
+    @_querymethod
+    def eol_within(cls, __days: int, today=None) -> 'VersionSequence':
+        """Get the branches reaching end-of-life within a number of days.
+
+        Args:
+            __days: Window length in days.
+            today: Start of the window as a 'date' or 'YYYY-MM-DD' string (default is today).
+
+        Returns:
+            VersionSequence: 'PyActive' records whose 'end_date' falls within the window (inclusive), sorted by version.
+
+        Raises:
+            PyVersionException: Raised for invalid dates.
+        """
+        start = date.today() if today is None else _as_date(today)
+        return cls._tracker()._release_index().lifecycle.eol_between(start, date.fromordinal(start.toordinal() + int(__days)))
+    
+    @_querymethod
+    def supported_on(cls, __on=None) -> 'VersionSequence':
+        """Get the branches supported on a date (released on or before it and not yet end-of-life).
+
+        Args:
+            __on: A 'date' or 'YYYY-MM-DD' string (default is today).
+
+        Returns:
+            VersionSequence: The supported 'PyActive' records, sorted by version.
+
+        Raises:
+            PyVersionException: Raised for invalid dates.
+        """
+        return cls._tracker()._release_index().lifecycle.supported_on(date.today() if __on is None else _as_date(__on))
+    
+    @_querymethod
+    def is_supported(cls, __version: str, on=None) -> Union[bool, NoReturn]:
+        """Check if a version's branch is supported on a date.
+
+        Args:
+            __version: Version string (X.Y.Z or X.Y).
+            on: A 'date' or 'YYYY-MM-DD' string (default is today).
+
+        Returns:
+            Union[bool, NoReturn]: True if the version's X.Y branch is supported on that date.
+
+        Raises:
+            PyVersionException: Raised for invalid versions, versions that are not
+                known releases, or invalid dates.
+        """
+        version: str = cls._validate_version(__version)
+        tracker = cls._tracker()
+        if version not in tracker._release_index().by_version:
+            cls._base_error()
+        major, minor = cls.str2tuple(version)[:2]
+        return tracker.supported_on(on).find((major, minor)) is not None
+    
+    @_querymethod
+    def first_release_after(cls, __on) -> Union[PyVersion, None]:
+        """Get the first release published after a date.
+
+        Args:
+            __on: A 'date' or 'YYYY-MM-DD' string.
+
+        Returns:
+            Union[PyVersion, None]: The earliest later release (the newest version if several
+                share that day), or None if there is none.
+
+        Raises:
+            PyVersionException: Raised for invalid dates.
+        """
+        return cls._tracker()._release_index().lifecycle.first_release_after(_as_date(__on))
+    
+    @property
+    def unsupported_versions(self) -> 'VersionSequence':
         """Get unsupported versions.
 
         Returns:
-            Generator: Generator of version strings.
+            VersionSequence: Re-iterable view of deprecated 'PyVersion' records, sorted by version.
 
         Raises:
             None
         """
-        return self._unsupported_v()
+        return self._release_index().unsupported_versions
+    
+    @property
+    def release_columns(self) -> ReleaseColumns:
+        """Get every release as parallel arrays, for low-memory bulk filtering.
+
+        Returns:
+            ReleaseColumns: Version strings with 'array' columns of major, minor and micro
+                numbers, release date ordinals and deprecation flags, in page order.
+
+        Raises:
+            None
+        """
+        return self._release_index().columns
     
     @classmethod
     def package_tracker(cls, method: str='overall', **kwargs) -> Any:
@@ -408,12 +1586,109 @@ class PyVersionTracker:
         Raises:
             PyVersionException: Raised for invalid tracking methods.
         """
+        import pypistats
+        
         try:
             return getattr(pypistats, method)(**kwargs)
         except AttributeError as attr_error:
             raise PyVersionException(attr_error)
     
+    _PYPISTATS_API = 'https://pypistats.org/api/'
+    # The single filter parameter each pypistats endpoint accepts.
+    _STATS_PARAMS = {'recent': 'period', 'overall': 'mirrors', 'python_major': 'version',
+                    'python_minor': 'version', 'system': 'os'}
+    _STATS: Dict[Tuple[str, str, Tuple[Tuple[str, str], ...]], Tuple[float, NamedTuple]] = {}
+    
     @classmethod
+    def _stats_key(cls, __method: str, __package: str, __params: Dict[str, Any]) -> Tuple[str, str, Tuple[Tuple[str, str], ...]]:
+        if __method not in cls._STATS_PARAMS:
+            raise PyVersionException(
+                f'Invalid tracking method {__method!r}. Choose from: {", ".join(cls._STATS_PARAMS)}.'
+                )
+        name = cls._STATS_PARAMS[__method]
+        value = __params.get(name)
+        if isinstance(value, bool):
+            value = str(value).lower()
+        return __method, __package.lower(), ((name, str(value)),) if value else ()
+    
+    @classmethod
+    async def _afetch_stats(cls, __key, semaphore, retries: int, backoff: float, ttl: float) -> NamedTuple:
+        import json
+        import asyncio
+        from urllib.parse import urlencode
+        from aiohttp import ClientResponseError
+        
+        method, package, params = __key
+        if (cached := cls._STATS.get(__key)) is not None and cached[0] > time.monotonic():
+            return cached[1]
+        url = urljoin(cls._PYPISTATS_API, f'packages/{package}/{method}')
+        if params:
+            url = f'{url}?{urlencode(params)}'
+        for attempt in range(retries + 1):
+            try:
+                async with semaphore:
+                    payload = json.loads(await cls._request_py(url))
+                break
+            except ValueError as json_error:
+                return PyPackageStats(package, method, params, (), f'Invalid JSON from {url}: {json_error}')
+            except PyVersionException as request_error:
+                cause = request_error.__cause__
+                client_error = isinstance(cause, ClientResponseError) and 400 <= cause.status < 500
+                if client_error or attempt == retries:
+                    return PyPackageStats(package, method, params, (), f'{request_error} ({cause})')
+                await asyncio.sleep(backoff * 2 ** attempt)
+        
+        stats = PyPackageStats(package, method, params, tuple(payload.get('data') or ()), None)
+        cls._STATS[__key] = (time.monotonic() + ttl, stats)
+        return stats
+    
+    @classmethod
+    async def apackage_tracker_many(cls, __packages, methods=('overall',), *,
+                                    params=None,
+                                    concurrency: int=10,
+                                    retries: int=3,
+                                    backoff: float=0.5,
+                                    cache_ttl: float=3600) -> List[NamedTuple]:
+        """Fetch pypistats download statistics for many packages and methods concurrently.
+
+        Requests go to the pypistats JSON API ('_PYPISTATS_API', which can point at a
+        local stub server) through the pooled session, with at most 'concurrency' in
+        flight. Identical requests are made once, failures are retried with exponential
+        backoff on connection and server errors, and successful responses are cached
+        in memory for 'cache_ttl' seconds, keyed by (method, package, params).
+
+        Args:
+            __packages: Iterable of package names.
+            methods: pypistats methods to query per package (default is ('overall',)).
+            params: Endpoint filters by pypistats keyword, e.g. {'period': 'week', 'mirrors': False,
+                'version': '3.11', 'os': 'Linux'}; each method uses the one it accepts.
+            concurrency: Maximum number of requests in flight (default is 10).
+            retries: Retries per request after a failure (default is 3).
+            backoff: Initial delay in seconds between retries, doubled each time (default is 0.5).
+            cache_ttl: Seconds a response is served from memory (default is 3600).
+
+        Returns:
+            List: PyPackageStats namedtuples, one per distinct (method, package, params) in
+                input order, holding the rows of the response or the error the request failed with.
+
+        Raises:
+            PyVersionException: Raised for invalid tracking methods.
+        """
+        import asyncio
+        
+        params = params or {}
+        keys = list(dict.fromkeys(cls._stats_key(method, package, params)
+                                for package in __packages for method in methods))
+        semaphore = asyncio.Semaphore(concurrency)
+        return list(await asyncio.gather(*(cls._afetch_stats(key, semaphore, retries, backoff, cache_ttl)
+                                            for key in keys)))
+    
+    @classmethod
+    def package_tracker_many(cls, __packages, methods=('overall',), **kwargs) -> List[NamedTuple]:
+        """Synchronous counterpart of 'apackage_tracker_many' (accepts the same arguments)."""
+        return run_sync(cls.apackage_tracker_many(__packages, methods, **kwargs))
+    
+    @_querymethod
     def version_checker(cls, __sys_version=None, minimum_version=None) -> Union[bool, NoReturn]:
         """Check if the current Python version meets the specified minimum requirements.
 
@@ -434,24 +1709,101 @@ class PyVersionTracker:
         if __sys_version is None:
             __sys_version = sys.version
         
+        tracker = cls._tracker()
         if minimum_version is None:
-            minimum_version = cls().min_stable_version.version
+            minimum_version = tracker.min_stable_version.version
         
         sys_version = _sys_version(__sys_version)[1]
         min_version = cls._validate_version(minimum_version)
         less_than = operator.lt(*map(cls.str2tuple, (sys_version, min_version)))
         if less_than:
             raise PyVersionException(
-            f"{cls.__name__!r} requires Python {min_version!r} or a more recent version for optimal functionality.\n"
+            f"{type(tracker).__name__!r} requires Python {min_version!r} or a more recent version for optimal functionality.\n"
             f"Your current Python version is {sys_version!r}, which has been assessed and flagged as potentially incompatible.\n"
             "Kindly consider upgrading your Python installation to meet the minimum required version and attempt the operation again."
             )
         
         return True
+    
+    _CHECK_CHUNK = 10_000
+    # Below this many chunks, pickling to and from workers costs more than the checks save.
+    _POOL_MIN_CHUNKS = 10
+    
+    @_querymethod
+    def version_checker_many(cls, __sys_versions, minimum_version=None,
+                            processes=None) -> Generator[NamedTuple, None, None]:
+        """Check a fleet of interpreters against the minimum version without raising.
+
+        Every verdict is computed against one release index snapshot, loaded once up
+        front, and nothing is fetched per host. Input is consumed in chunks of 10,000,
+        so inventories can be streamed; inventories of 100,000 or more are checked in a
+        process pool on multi-core hosts. Workers are spawned, so scripts using the pool
+        must call this under an 'if __name__ == "__main__":' guard.
+
+        Args:
+            __sys_versions: Iterable of 'sys.version' strings, (host, sys_version) pairs,
+                or mappings with 'host' and 'sys_version' (or 'version') keys, such as CSV or JSONL rows.
+            minimum_version (str, optional): The minimum required version (default is the minimum stable version).
+            processes (int, optional): Worker processes for large inventories; 1 checks everything
+                in this process (default is the number of CPUs).
+
+        Returns:
+            Generator: PyVerdict namedtuples in input order, each with the parsed version (None if
+                unparseable) and a verdict of 'ok', 'below_minimum', 'deprecated' or 'unknown'
+                (unparseable, a pre-release or dev build, or not a known release).
+
+        Raises:
+            PyVersionException: Raised for an invalid minimum version or if the release index cannot be loaded.
+        """
+        from itertools import chain, islice
+        
+        tracker = cls._tracker()
+        index: ReleaseIndex = tracker._release_index()
+        if minimum_version is None:
+            minimum_version = tracker.min_stable_version.version
+        minimum = parse_version(minimum_version, strict=True)
+        deprecated = {record.version_info: bool(record.deprecated) for record in index.versions}
+        items = map(_inventory_item, __sys_versions)
+        chunks = iter(lambda: list(islice(items, cls._CHECK_CHUNK)), [])
+        
+        workers = processes or os.cpu_count() or 1
+        
+        def _verdicts():
+            head = list(islice(chunks, cls._POOL_MIN_CHUNKS))
+            if len(head) < cls._POOL_MIN_CHUNKS or workers == 1:
+                for chunk in chain(head, chunks):
+                    yield from _check_chunk(deprecated, minimum, chunk)
+            else:
+                yield from cls._check_in_pool(deprecated, minimum, chain(head, chunks), workers)
+        
+        return _verdicts()
+    
+    @staticmethod
+    def _check_in_pool(__deprecated, __minimum, __chunks, __workers: int):
+        from collections import deque
+        from multiprocessing import get_context
+        from concurrent.futures import ProcessPoolExecutor
+        
+        workers = __workers
+        pending = deque()
+        # 'spawn' because the tracker keeps a background I/O thread, which makes forking unsafe.
+        with ProcessPoolExecutor(workers, mp_context=get_context('spawn')) as pool:
+            for chunk in __chunks:
+                pending.append(pool.submit(_check_chunk, __deprecated, __minimum, chunk))
+                # A bounded window keeps streamed inventories from being read into memory at once.
+                if len(pending) > 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+atexit.register(shutdown, PyVersionTracker._SESSIONS.close)
 
-PyVersionTracker.version_checker(sys.version, '3.8')
+# A fully qualified minimum version is validated locally (no call to 'is_version'),
+# so this import-time interpreter check never touches python.org.
+PyVersionTracker.version_checker(sys.version, '3.8.0')
 
-__all__ = ('PyVersionTracker', 'PyVersionException')
+__all__ = ('PyVersionTracker', 'PyVersionException', 'ReleaseIndex', 'ReleaseColumns', 'VersionSequence', 'LifecycleIndex',
+            'PyVersion', 'PyActive', 'PyFile', 'PyRelease', 'PyVerdict', 'PyPackageStats')
 __version__ = "0.0.1"
 __author__ = "Yousef Abuzahrieh <yousef.zahrieh17@gmail.com"
 
@@ -459,12 +1811,21 @@ __doc__ = """
 PyVersionTracker: Python Version Information Tracker
 
 This module provides a Python version information tracker that fetches and parses data from the official Python downloads page (https://www.python.org/downloads).
-It uses asynchronous HTTP requests, BeautifulSoup for HTML parsing, and provides functionalities to extract information about stable and active Python versions,
+It uses asynchronous HTTP requests over pooled sessions, BeautifulSoup for HTML parsing, and provides functionalities to extract information about stable and active Python versions,
 including their release dates, deprecation status, and more.
 
 Classes:
     - PyVersionTracker: Main class for tracking Python version information.
     - PyVersionException: Custom exception class for handling errors in PyVersionTracker.
+    - ReleaseIndex: Immutable index of the downloads page, built in a single pass over the parsed HTML.
+    - PyVersion, PyActive, PyFile, PyRelease, PyVerdict, PyPackageStats: Module-level record types.
+    - ReleaseColumns: Parallel-array view of every release for bulk filtering.
+    - LifecycleIndex: Date indexes for end-of-life, support and release date queries.
+    - VersionSequence: Sorted, re-iterable view of release records with bisect lookups by version.
+    - StreamingExtractor: Tree-less extractor of the release index columns (see 'parsers').
+    - MappedIndex: Zero-copy view of a binary release index export (see 'export').
+    - TrackerStats: Opt-in instrumentation counters and stage timings (see 'instrumentation').
+    - SnapshotCache: Persistent on-disk cache of release indexes with TTL and HTTP revalidation (see 'cache').
 
 Module Dependencies:
     - re: Regular expression library for pattern matching.
@@ -492,10 +1853,30 @@ Methods:
     - PyVersionTracker.active_versions: Get active versions with status information.
     - PyVersionTracker.is_version: Check if a version is in the accepted range of Python versions.
     - PyVersionTracker.is_deprecated: Check if a version is deprecated.
+    - PyVersionTracker.classify_versions: Classify the support status of many versions in one pass.
     - PyVersionTracker.str2tuple: Convert a version string to a tuple of integers.
+    - PyVersionTracker.parse_versions: Parse many version strings to (major, minor, micro) tuples.
+    - PyVersionTracker.compare_many: Compare many versions pairwise.
+    - PyVersionTracker.satisfies_minimum: Check many versions against a minimum version.
     - PyVersionTracker.version_range: Get versions within a specified range.
     - PyVersionTracker.unsupported_versions: Get unsupported versions.
+    - PyVersionTracker.release_series: Get every patch release of a minor series.
+    - PyVersionTracker.latest_patches: Get the latest patch release of each minor series.
+    - PyVersionTracker.eol_within: Get the branches reaching end-of-life within a number of days.
+    - PyVersionTracker.supported_on: Get the branches supported on a date.
+    - PyVersionTracker.is_supported: Check if a version's branch is supported on a date.
+    - PyVersionTracker.first_release_after: Get the first release published after a date.
     - PyVersionTracker.package_tracker: Track package download statistics using pypistats.
+    - PyVersionTracker.package_tracker_many: Fetch download statistics for many packages concurrently, with caching.
+    - PyVersionTracker.version_checker_many: Audit a fleet of interpreters against the minimum version.
+    - PyVersionTracker.refresh_snapshot: Write the release snapshot used by offline mode.
+    - PyVersionTracker.export_index: Export the release index to JSON Lines, CSV or a memory-mappable binary file.
+    - PyVersionTracker.enrich_versions: Attach release page artifacts (files, sizes, checksums, signatures).
+    - PyVersionTracker.shared: Get the process-wide tracker, loaded once for all threads.
+    - PyVersionTracker.afetch: Load the release index from within a running event loop.
+    - PyVersionTracker.reload: Revalidate the release index now and replace the in-memory copy.
+    - PyVersionTracker.instrument: Opt in to stage timings, cache hit/miss and HTTP counters.
+    - PyVersionTracker.aclose: Close the running event loop's pooled HTTP session.
 
 Example Usage:
     - Instantiate PyVersionTracker: tracker = PyVersionTracker()
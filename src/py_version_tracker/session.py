@@ -0,0 +1,193 @@
+import threading
+# asyncio (and aiohttp) are imported on first use to keep 'import py_version_tracker' cheap.
+from weakref import WeakKeyDictionary
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Hashable, Optional, TypeVar
+
+
+_T = TypeVar('_T')
+
+
+class SessionPool:
+    """
+    ### Pooled aiohttp sessions and single-flight request coalescing.
+
+    One 'ClientSession' is kept per event loop so connections are reused
+    (keep-alive) across requests, and concurrent callers asking for the same
+    key on the same loop share one in-flight task instead of issuing
+    duplicate requests.
+
+    Attributes:
+        timeout: Seconds a whole request (connect, send and read) may take, or None for no limit.
+        connector_options: Keyword arguments for each loop's 'aiohttp.TCPConnector'.
+    """
+
+    def __init__(self, timeout: Optional[float]=None, **connector_options):
+        self.timeout = timeout
+        self.connector_options: Dict[str, Any] = connector_options
+        self._sessions: 'WeakKeyDictionary[Any, Any]' = WeakKeyDictionary()
+        self._inflight: 'WeakKeyDictionary[Any, Dict[Hashable, Any]]' = WeakKeyDictionary()
+
+    async def session(self) -> Any:
+        """Get the pooled 'aiohttp.ClientSession' of the running event loop, creating it on first use."""
+        import asyncio
+        from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = ClientSession(connector=TCPConnector(**self.connector_options),
+                                    timeout=ClientTimeout(total=self.timeout),
+                                    raise_for_status=True)
+            self._sessions[loop] = session
+        return session
+
+    async def coalesce(self, __key: Hashable, __factory: Callable[[], Awaitable[_T]]) -> _T:
+        """Await the in-flight task for a key, starting it with the factory if there is none.
+
+        Args:
+            __key: Identity of the work (e.g. the URL and request headers).
+            __factory: Zero-argument callable returning the awaitable to run.
+
+        Returns:
+            The task's result, shared by every concurrent caller with the same key.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.setdefault(loop, {})
+        task = inflight.get(__key)
+        if task is None:
+            task = inflight[__key] = loop.create_task(__factory())
+            task.add_done_callback(lambda _task: inflight.pop(__key, None))
+        # Shielded so a cancelled caller does not cancel the fetch for the others.
+        return await asyncio.shield(task)
+
+    async def close(self) -> None:
+        """Close the running event loop's pooled session."""
+        import asyncio
+
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+
+class SingleFlight:
+    """
+    ### Thread-level single-flight execution.
+
+    The threaded counterpart of 'SessionPool.coalesce': while one thread runs the
+    work for a key, other threads asking for the same key block until it finishes
+    and get its result (or its exception) instead of repeating the work. Nothing
+    is cached once the call completes; callers keep the result themselves.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, '_Call'] = {}
+
+    def do(self, __key: Hashable, __factory: Callable[[], _T]) -> _T:
+        """Run the factory for a key, or wait for the thread already running it.
+
+        Args:
+            __key: Identity of the work (e.g. the URL being loaded).
+            __factory: Zero-argument callable doing the work.
+
+        Returns:
+            The factory's result, shared by every concurrent caller with the same key.
+        """
+        with self._lock:
+            call = self._calls.get(__key)
+            leader = call is None
+            if leader:
+                call = self._calls[__key] = _Call()
+        if not leader:
+            return call.wait()
+        try:
+            call.result = __factory()
+        except BaseException as factory_error:
+            call.error = factory_error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[__key]
+            call.done.set()
+        return call.result
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+    def wait(self) -> Any:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class _LoopThread:
+    """A daemon thread running the event loop that synchronous callers submit coroutines to."""
+
+    def __init__(self):
+        self._loop = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> Any:
+        import asyncio
+
+        with self._lock:
+            if self._loop is None:
+                ready = threading.Event()
+
+                def _serve():
+                    self._loop = asyncio.new_event_loop()
+                    asyncio.set_event_loop(self._loop)
+                    ready.set()
+                    self._loop.run_forever()
+
+                self._thread = threading.Thread(target=_serve, name='py-version-tracker-io', daemon=True)
+                self._thread.start()
+                ready.wait()
+            return self._loop
+
+    def run(self, __coro: Coroutine[Any, Any, _T]) -> _T:
+        import asyncio
+
+        if self._thread is threading.current_thread():
+            __coro.close()
+            raise RuntimeError('Synchronous PyVersionTracker calls cannot be made from its own I/O loop.')
+        return asyncio.run_coroutine_threadsafe(__coro, self._ensure_loop()).result()
+
+    def shutdown(self, *cleanups: Callable[[], Coroutine[Any, Any, None]]) -> None:
+        if self._loop is None or self._loop.is_closed():
+            return
+        for cleanup in cleanups:
+            try:
+                self.run(cleanup())
+            except Exception:
+                pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+
+_io_loop = _LoopThread()
+
+
+def run_sync(__coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine to completion from synchronous code.
+
+    The coroutine runs on a shared background event loop, so it works whether or
+    not the calling thread already has a running loop, and pooled sessions stay
+    alive between synchronous calls.
+    """
+    return _io_loop.run(__coro)
+
+
+def shutdown(*cleanups: Callable[[], Coroutine[Any, Any, None]]) -> None:
+    """Run the given cleanup coroutines on the background loop and stop it."""
+    _io_loop.shutdown(*cleanups)
@@ -0,0 +1,198 @@
+import re
+from array import array
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
+
+# NumPy is optional and imported on first use; see '_numpy'.
+
+
+VersionLike = Union[str, Tuple[int, ...], None]
+
+# First X.Y[.Z] run in the text, so 'sys.version' strings, requirement specifiers
+# ('>=3.8', '~=3.11.0') and labels ('Python 3.12.0rc1') all parse.
+_VERSION_PATTERN = re.compile(r'(?<![\d.])(\d+)\.(\d+)(?:\.(\d+))?')
+# Pre-release, dev and local build markers right after the version ('3.12.0rc1', '3.13.0a1+', '3.12.0.dev0').
+_PRERELEASE_SUFFIX = re.compile(r'[.-]?[A-Za-z]|\+')
+_PACK_BITS = 20
+_PACK_LIMIT = 1 << _PACK_BITS
+# Inputs at least this long are compared with NumPy when it is installed.
+NUMPY_THRESHOLD = 50_000
+
+
+@lru_cache(maxsize=65536)
+def _parse_text(__text: str) -> Optional[Tuple[int, int, int]]:
+    match = _VERSION_PATTERN.search(__text)
+    if match is None:
+        return None
+    major, minor, micro = match.groups()
+    return int(major), int(minor), int(micro or 0)
+
+
+@lru_cache(maxsize=65536)
+def _parse_final(__text: str) -> Optional[Tuple[int, int, int]]:
+    # Like '_parse_text', but None unless the version is a final release.
+    match = _VERSION_PATTERN.search(__text)
+    if match is None or _PRERELEASE_SUFFIX.match(__text, match.end()):
+        return None
+    major, minor, micro = match.groups()
+    return int(major), int(minor), int(micro or 0)
+
+
+def parse_version(__version: VersionLike, strict: bool=False) -> Optional[Tuple[int, int, int]]:
+    """Parse one version to a (major, minor, micro) tuple.
+
+    Args:
+        __version: Version string (any text containing X.Y or X.Y.Z) or integer tuple.
+        strict: Raise instead of returning None for unparseable input (default is False).
+
+    Returns:
+        Optional[Tuple[int, int, int]]: The parsed version, X.Y parsing as X.Y.0.
+
+    Raises:
+        PyVersionException: Raised for unparseable input when 'strict' is set.
+    """
+    if isinstance(__version, str):
+        parsed = _parse_text(__version)
+    elif isinstance(__version, tuple) and 2 <= len(__version) <= 3 \
+            and all(isinstance(i, int) and i >= 0 for i in __version):
+        parsed = tuple(__version) + (0,) * (3 - len(__version))
+    else:
+        parsed = None
+    if parsed is None and strict:
+        from .py_version_tracker import PyVersionException
+
+        raise PyVersionException(
+            f'The provided version ({__version!r}) cannot be interpreted as a valid version. \n'
+            'Please use the format X.Y.Z or X.Y.'
+            )
+    return parsed
+
+
+def parse_versions(__versions: Iterable[VersionLike], strict: bool=False) -> List[Optional[Tuple[int, int, int]]]:
+    """Parse many versions to (major, minor, micro) tuples.
+
+    Parsing goes through one precompiled pattern and an LRU cache, so fleets with
+    many repeated interpreter strings are parsed once per distinct string.
+
+    Args:
+        __versions: Iterable of version strings or integer tuples.
+        strict: Raise on the first unparseable version instead of yielding None (default is False).
+
+    Returns:
+        List: Parsed versions in input order (None for unparseable input unless 'strict').
+
+    Raises:
+        PyVersionException: Raised for unparseable input when 'strict' is set.
+    """
+    return [parse_version(v, strict) for v in __versions]
+
+
+def _pack(__parsed: Optional[Tuple[int, int, int]]) -> int:
+    # Components must fit in 20 bits; anything else packs like unparseable input.
+    if __parsed is None:
+        return -1
+    major, minor, micro = __parsed
+    if max(__parsed) >= _PACK_LIMIT:
+        return -1
+    return (major << 2 * _PACK_BITS) | (minor << _PACK_BITS) | micro
+
+
+def pack_versions(__versions: Iterable[VersionLike]) -> Any:
+    """Pack versions into one sortable 64-bit integer each (-1 for unparseable input).
+
+    Returns:
+        A NumPy int64 array when NumPy is installed, otherwise an 'array.array' of signed 64-bit integers.
+    """
+    packed = map(_pack, map(parse_version, __versions))
+    np = _numpy()
+    if np is not None:
+        return np.fromiter(packed, dtype=np.int64)
+    return array('q', packed)
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _use_numpy(__size: int, use_numpy: Optional[bool]) -> Any:
+    if use_numpy is False or (use_numpy is None and __size < NUMPY_THRESHOLD):
+        return None
+    np = _numpy()
+    if np is None and use_numpy:
+        from .py_version_tracker import PyVersionException
+
+        raise PyVersionException('Vectorized comparison requires NumPy to be installed.')
+    return np
+
+
+def compare_many(a: Iterable[VersionLike], b: Union[VersionLike, Iterable[VersionLike]],
+                use_numpy: Optional[bool]=None) -> List[Optional[int]]:
+    """Compare versions pairwise, like 'cmp'.
+
+    Args:
+        a: Iterable of versions.
+        b: A single version compared against every item of 'a', or an iterable of the same length.
+        use_numpy: Force (True) or disable (False) the NumPy path (default is NumPy for large inputs when installed).
+
+    Returns:
+        List: -1, 0 or 1 per pair, or None where either side is unparseable.
+
+    Raises:
+        PyVersionException: Raised if the iterables differ in length or NumPy is forced but missing.
+    """
+    left: Sequence[Optional[Tuple[int, int, int]]] = parse_versions(a)
+    if b is None or isinstance(b, str) or (isinstance(b, tuple) and all(isinstance(i, int) for i in b)):
+        right: Sequence[Optional[Tuple[int, int, int]]] = list(repeat(parse_version(b), len(left)))
+    else:
+        right = parse_versions(b)
+    if len(left) != len(right):
+        from .py_version_tracker import PyVersionException
+
+        raise PyVersionException(f'Cannot compare {len(left)} versions with {len(right)} versions.')
+    compare = lambda i, j: None if i is None or j is None else (i > j) - (i < j)
+    np = _use_numpy(len(left), use_numpy)
+    if np is not None:
+        x = np.fromiter(map(_pack, left), dtype=np.int64, count=len(left))
+        y = np.fromiter(map(_pack, right), dtype=np.int64, count=len(right))
+        result = np.sign(x - y).astype(object)
+        # Unparseable items and components too large to pack are compared in Python.
+        for idx in np.flatnonzero((x < 0) | (y < 0)).tolist():
+            result[idx] = compare(left[idx], right[idx])
+        return result.tolist()
+    return [compare(i, j) for i, j in zip(left, right)]
+
+
+def satisfies_minimum(__versions: Iterable[VersionLike], min_version: VersionLike,
+                    use_numpy: Optional[bool]=None) -> List[bool]:
+    """Check many versions against a minimum version.
+
+    Args:
+        __versions: Iterable of versions (e.g. 'sys.version' strings or requirement specifiers).
+        min_version: The minimum required version.
+        use_numpy: Force (True) or disable (False) the NumPy path (default is NumPy for large inputs when installed).
+
+    Returns:
+        List[bool]: Whether each version is at least 'min_version' (False for unparseable input).
+
+    Raises:
+        PyVersionException: Raised for an invalid minimum version or if NumPy is forced but missing.
+    """
+    minimum = parse_version(min_version, strict=True)
+    parsed = parse_versions(__versions)
+    np = _use_numpy(len(parsed), use_numpy) if _pack(minimum) >= 0 else None
+    if np is not None:
+        packed = np.fromiter(map(_pack, parsed), dtype=np.int64, count=len(parsed))
+        result = (packed >= _pack(minimum)).tolist()
+        # Unparseable items and components too large to pack are checked in Python.
+        for idx in np.flatnonzero(packed < 0).tolist():
+            result[idx] = parsed[idx] is not None and parsed[idx] >= minimum
+        return result
+    return [v is not None and v >= minimum for v in parsed]
+
+
+__all__ = ('parse_version', 'parse_versions', 'pack_versions', 'compare_many', 'satisfies_minimum')
@@ -0,0 +1,64 @@
+"""
+Shared fixtures for the test suite.
+
+Like the benchmarks, the tests never talk to python.org: they reuse the local
+HTTP stand-in from ``benchmarks/_harness.py``, which serves the synthetic copy
+of the downloads page (and puts ``src`` on the import path).
+"""
+import sys
+import socket
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'benchmarks'))
+
+from _harness import reset_caches, serve_fixture  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def cold_caches(monkeypatch, tmp_path):
+    """Start and end every test without in-process caches or cache environment overrides.
+
+    The default cache directory is moved into the test's temporary directory, so
+    nothing is written to the user's cache.
+    """
+    for name in ('PY_VERSION_TRACKER_CACHE_DIR', 'PY_VERSION_TRACKER_CACHE_TTL',
+                'PY_VERSION_TRACKER_OFFLINE', 'PY_VERSION_TRACKER_SNAPSHOT'):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'xdg-cache'))
+    reset_caches()
+    yield
+    reset_caches()
+
+
+@pytest.fixture
+def fixture_url():
+    """URL of the synthetic downloads page on a running local stand-in."""
+    with serve_fixture() as url:
+        yield url
+
+
+@pytest.fixture
+def disable_network(monkeypatch):
+    """Return a function that refuses every later socket connection and lists the attempts."""
+    attempts = []
+
+    def _refuse(sock, address):
+        attempts.append(address)
+        raise ConnectionRefusedError(f'Network access is disabled in this test ({address}).')
+
+    def _disable():
+        monkeypatch.setattr(socket.socket, 'connect', _refuse)
+        monkeypatch.setattr(socket.socket, 'connect_ex', _refuse)
+        return attempts
+    return _disable
+
+
+@pytest.fixture
+def tracker(fixture_url, monkeypatch):
+    """'PyVersionTracker' pointed at the local stand-in of the downloads page."""
+    from py_version_tracker import PyVersionTracker
+
+    monkeypatch.setattr(PyVersionTracker, '_MAIN_PG', fixture_url)
+    return PyVersionTracker
@@ -0,0 +1,29 @@
+"""Concurrent cold starts share one fetch and parse (see 'benchmarks/bench_concurrency.py')."""
+import pytest
+
+from bench_concurrency import cold_soup, cold_start, warm_queries
+
+
+@pytest.fixture
+def uncached_tracker(tracker, monkeypatch):
+    # Every cold load must fetch and parse the page, not read a disk snapshot.
+    monkeypatch.setenv('PY_VERSION_TRACKER_CACHE_DIR', 'off')
+    return tracker
+
+
+def test_cold_start_fetches_and_parses_once(uncached_tracker):
+    result = cold_start(uncached_tracker, 16)
+    assert result['errors'] == []
+    assert (result['http_requests'], result['parses'], result['distinct_trackers']) == (1, 1, 1)
+
+
+def test_concurrent_soupify_builds_one_tree(uncached_tracker):
+    result = cold_soup(uncached_tracker, 16)
+    assert result['errors'] == []
+    assert (result['http_requests'], result['soups_built'], result['distinct_soups']) == (1, 1, 1)
+
+
+def test_queries_survive_concurrent_reloads(uncached_tracker):
+    cold_start(uncached_tracker, 4)
+    result = warm_queries(uncached_tracker, 8, 50, seed=0)
+    assert result['errors'] == []
@@ -0,0 +1,79 @@
+"""Background refresh: release events between indexes, publishing, and the shared socket."""
+import json
+import socket
+
+import pytest
+
+from py_version_tracker import PyVersionException, ReleaseEvent, ReleaseRefresher, diff_indexes, request_index
+from py_version_tracker.py_version_tracker import ReleaseIndex
+
+
+OLD = ReleaseIndex(
+    releases=[('3.12.0', 'Oct. 2, 2023'), ('3.11.5', 'Aug. 24, 2023'), ('3.8.18', 'Aug. 24, 2023')],
+    active=[('3.12', 'bugfix', '2023-10-02', '2028-10', 'PEP 693'),
+            ('3.11', 'bugfix', '2022-10-24', '2027-10', 'PEP 664'),
+            ('3.8', 'security', '2019-10-14', '2024-10', 'PEP 569'),
+            ('3.7', 'security', '2018-06-27', '2023-06-27', 'PEP 537')],
+    featured='3.12.0',
+    )
+NEW = ReleaseIndex(
+    releases=[('3.12.1', 'Dec. 8, 2023'), ('3.12.0', 'Oct. 2, 2023'), ('3.11.5', 'Aug. 24, 2023'),
+            ('3.8.18', 'Aug. 24, 2023')],
+    active=[('3.12', 'bugfix', '2023-10-02', '2028-10', 'PEP 693'),
+            ('3.11', 'security', '2022-10-24', '2027-10', 'PEP 664'),
+            ('3.8', 'end-of-life', '2019-10-14', '2024-10', 'PEP 569')],
+    featured='3.12.1',
+    )
+EVENTS = [ReleaseEvent(ReleaseEvent.RELEASED, '3.12.1', 'Dec. 8, 2023'),
+        ReleaseEvent(ReleaseEvent.STATUS_CHANGED, '3.11', 'bugfix -> security'),
+        ReleaseEvent(ReleaseEvent.END_OF_LIFE, '3.8', 'security'),
+        ReleaseEvent(ReleaseEvent.END_OF_LIFE, '3.7', 'security')]
+
+
+class _FeedTracker:
+    """Stands in for 'PyVersionTracker', returning one index per 'reload'."""
+    _MAIN_PG = 'https://www.python.org/downloads/'
+
+    def __init__(self, *indexes):
+        self.indexes = list(indexes)
+
+    def reload(self, url=''):
+        return self.indexes.pop(0)
+
+
+def test_diff_reports_releases_and_end_of_life():
+    assert diff_indexes(OLD, NEW) == EVENTS
+    assert [str(event) for event in EVENTS[::2]] == ['3.12.1 released', '3.8 went end-of-life']
+    assert diff_indexes(NEW, NEW) == []
+
+
+def test_refresh_publishes_and_notifies(tmp_path):
+    snapshot = tmp_path / 'releases.json'
+    refresher = ReleaseRefresher(_FeedTracker(OLD, NEW, NEW), snapshot=snapshot)
+    received = []
+    refresher.subscribe(received.append)
+
+    assert refresher.refresh() == []
+    assert json.loads(snapshot.read_text())['featured'] == '3.12.0'
+    assert refresher.refresh() == EVENTS
+    assert received == EVENTS
+    assert json.loads(snapshot.read_text())['featured'] == '3.12.1'
+    assert refresher.refresh() == []
+    assert received == EVENTS and refresher.index is NEW
+
+
+def test_live_socket_is_not_taken_over(tmp_path):
+    path = tmp_path / 'refresher.sock'
+    with ReleaseRefresher(_FeedTracker(OLD), socket_path=path, interval=3600):
+        assert request_index(path).featured == '3.12.0'
+        with pytest.raises(PyVersionException, match='already serving'):
+            ReleaseRefresher(_FeedTracker(NEW), socket_path=path).start()
+        assert request_index(path).featured == '3.12.0'
+
+
+def test_stale_socket_is_replaced(tmp_path):
+    path = tmp_path / 'refresher.sock'
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(str(path))  # bound but never listening, like a refresher that crashed
+    with ReleaseRefresher(_FeedTracker(NEW), socket_path=path, interval=3600):
+        assert request_index(path).featured == '3.12.1'
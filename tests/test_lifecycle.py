@@ -0,0 +1,46 @@
+"""Lifecycle date queries, checked against a brute-force scan of the release index."""
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from py_version_tracker import PyVersionException
+
+
+@pytest.fixture
+def index(tracker):
+    return tracker()._release_index()
+
+
+def _random_days(__index, count: int=2000, seed: int=0):
+    days = [record.date for record in __index.records if record.date]
+    days += [d for branch in __index.active_versions for d in (branch.start_date, branch.end_date) if d]
+    first, last = min(days).toordinal() - 30, max(days).toordinal() + 30
+    rng = random.Random(seed)
+    return [(date.fromordinal(rng.randint(first, last)), rng.randint(0, 800)) for _ in range(count)]
+
+
+def test_lifecycle_queries_match_a_brute_force_scan(tracker, index):
+    branches = [b for b in index.active_versions if b.start_date and b.end_date]
+    releases = [r for r in index.records if r.date]
+    for day, window in _random_days(index):
+        supported = {b.version for b in branches if b.start_date <= day < b.end_date}
+        assert {b.version for b in tracker.supported_on(day)} == supported
+
+        end = day + timedelta(days=window)
+        assert {b.version for b in tracker.eol_within(window, today=day)} == \
+                {b.version for b in index.active_versions if b.end_date and day <= b.end_date <= end}
+
+        later = [r for r in releases if r.date > day]
+        first = max(later, key=lambda r: (-r.date.toordinal(), r.version_info)) if later else None
+        assert tracker.first_release_after(day) == first
+
+        release = releases[day.toordinal() % len(releases)]
+        assert tracker.is_supported(release.version, on=day) == \
+                ('.'.join(release.version.split('.')[:2]) in supported)
+
+
+@pytest.mark.parametrize('version', ['3.8.99', 'foo 3.9 bar', '3.99', '3'])
+def test_is_supported_rejects_unknown_and_malformed_versions(tracker, version):
+    with pytest.raises(PyVersionException):
+        tracker.is_supported(version, on='2023-01-01')
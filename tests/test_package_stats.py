@@ -0,0 +1,90 @@
+"""Batched pypistats requests: deduplication, the TTL cache, and retries, against a stub API."""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from py_version_tracker import PyVersionTracker
+
+
+ROWS = [{'category': 'with_mirrors', 'date': '2023-10-01', 'downloads': 5}]
+# Status served for each package; 'broken' gets a truncated body and any other package its rows.
+STATUSES = {'missing': 404, 'flaky': 503}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        package = self.path.split('/')[3]
+        status = STATUSES.get(package, 200)
+        body = json.dumps({'data': ROWS, 'package': package} if status == 200 else {}).encode()
+        length = len(body)
+        if package == 'broken':
+            # Promise more bytes than are sent, then close the connection.
+            length, body = 1000, body[:12]
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(length))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_api(monkeypatch):
+    """Point the pypistats API at a local stub and yield the list of request paths it received."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+    server.daemon_threads = True
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(PyVersionTracker, '_PYPISTATS_API', f'http://127.0.0.1:{server.server_port}/api/')
+    try:
+        yield server.requests
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_identical_requests_are_made_once(stub_api):
+    results = PyVersionTracker.package_tracker_many(['Foo', 'foo', 'FOO'])
+    assert stub_api == ['/api/packages/foo/overall']
+    assert [(r.package, r.method, r.data, r.error) for r in results] == \
+            [('foo', 'overall', tuple(ROWS), None)]
+
+
+def test_responses_are_cached_for_the_ttl(stub_api):
+    first = PyVersionTracker.package_tracker_many(['foo'], cache_ttl=60)
+    second = PyVersionTracker.package_tracker_many(['foo'], cache_ttl=60)
+    assert second == first
+    assert len(stub_api) == 1
+
+    PyVersionTracker._STATS.clear()
+    PyVersionTracker.package_tracker_many(['foo'], cache_ttl=0)
+    PyVersionTracker.package_tracker_many(['foo'], cache_ttl=0)
+    assert len(stub_api) == 3
+
+
+def test_client_errors_are_not_retried(stub_api):
+    [result] = PyVersionTracker.package_tracker_many(['missing'], retries=3, backoff=0.001)
+    assert stub_api == ['/api/packages/missing/overall']
+    assert result.data == ()
+    assert '404' in result.error
+
+
+def test_server_errors_are_retried_then_reported(stub_api):
+    results = PyVersionTracker.package_tracker_many(['flaky', 'foo'], retries=2, backoff=0.001)
+    assert stub_api.count('/api/packages/flaky/overall') == 3
+    flaky, foo = results
+    assert flaky.data == () and '503' in flaky.error
+    assert foo.data == tuple(ROWS) and foo.error is None
+
+
+def test_truncated_responses_do_not_fail_the_batch(stub_api):
+    ok, broken = PyVersionTracker.package_tracker_many(['ok', 'broken'], retries=1, backoff=0.001)
+    assert ok.data == tuple(ROWS) and ok.error is None
+    assert broken.data == () and broken.error
+    assert stub_api.count('/api/packages/broken/overall') == 2
@@ -0,0 +1,48 @@
+"""Every parser backend extracts the same columns as a full html.parser tree.
+
+On malformed markup only the streaming extractor (the default) is held to that:
+strained trees are built differently once elements are left open.
+"""
+import pytest
+
+from _harness import DOWNLOADS_PAGE
+from py_version_tracker.parsers import available_backends, columns_from_soup, extract_columns
+
+bs4 = pytest.importorskip('bs4')
+
+# Malformed markup: spans left open, closed by their parent's end tag, and a stray end tag.
+UNCLOSED = """
+<p class="download-buttons">
+<a href="/ftp/python/3.12.0/">Download Python 3.12.0</a>
+</p>
+<ol class="list-row-container">
+<li><span class="release-number"><a href="/downloads/release/python-3120/">Python 3.12.0</a>
+    <span class="release-date">Oct. 2, 2023</li>
+<li><span class="release-number">Python <b>3.11.6</b></span><span class="release-date">Oct. 2, 2023</span></span></li>
+<li><span class="release-number"><a>Python 3.11.5</a> <a href="/late/">link</a></span>
+    <span class="release-date">Aug. 24, 2023</span></li>
+</ol>
+<ol class="list-row-container">
+<li><span class="release-version">3.12</span><span class="release-status">bugfix
+    <span class="release-start">2023-10-02</span><span class="release-end">2028-10</span>
+    <span class="release-pep"><a href="/dev/peps/pep-0693/">PEP 693</a></li>
+</ol>
+"""
+
+
+def _reference(__html):
+    return columns_from_soup(bs4.BeautifulSoup(__html, 'html.parser'))
+
+
+@pytest.mark.parametrize('backend', available_backends())
+def test_backends_match_the_full_tree_on_the_downloads_page(backend):
+    html = DOWNLOADS_PAGE.read_text(encoding='utf-8')
+    assert extract_columns(html, backend) == _reference(html)
+
+
+@pytest.mark.parametrize('backend', ['stream', 'auto'])
+def test_backends_match_the_full_tree_on_unclosed_spans(backend):
+    columns, featured = extract_columns(UNCLOSED, backend)
+    assert (columns, featured) == _reference(UNCLOSED)
+    assert featured == '3.12.0'
+    assert columns['release-link'][0] == '/downloads/release/python-3120/'
@@ -0,0 +1,45 @@
+"""Version queries served from the release index."""
+import pytest
+
+from py_version_tracker import PyVersionException
+
+
+@pytest.mark.parametrize('version', ['3.8.1', ' 3.8.1', '3.8.1 '])
+def test_padded_versions_are_normalized(tracker, version):
+    assert tracker.is_version(version) is True
+    assert tracker._validate_version(version) == '3.8.1'
+    [record] = tracker.classify_versions([version])
+    assert record.version == '3.8.1'
+
+
+@pytest.mark.parametrize('version', ['3', '3.8.1.2', 'foo 3.8.1 bar'])
+def test_malformed_versions_raise(tracker, version):
+    with pytest.raises(PyVersionException):
+        tracker.is_version(version)
+
+
+def test_version_range_series_upper_bound(tracker):
+    latest_311 = tracker.release_series('3.11')[-1].version
+    between = [record.version for record in tracker.version_range('3.8', '3.11')]
+    assert between[0] == '3.8.0' and between[-1] == latest_311
+    assert '3.11.1' in between and not any(v.startswith('3.12') for v in between)
+
+    exclusive = [record.version for record in tracker.version_range('3.8', '3.11', inclusive=False)]
+    assert exclusive[-1] == tracker.release_series('3.10')[-1].version
+    assert tracker.version_range('3.8', '3.11.2')[-1].version == '3.11.2'
+
+
+@pytest.mark.parametrize('bounds', [('3.8', 'foo'), ('foo', '3.11'), ('3.8', '3.11.2.1'), ('3.8', '3.99')])
+def test_version_range_validates_both_bounds(tracker, bounds):
+    with pytest.raises(PyVersionException):
+        tracker.version_range(*bounds)
+
+
+def test_release_columns_parallel_the_records(tracker):
+    instance = tracker()
+    columns = instance.release_columns
+    records = instance._release_index().records
+    assert columns.versions == tuple(record.version for record in records)
+    assert list(columns.deprecated) == [record.deprecated for record in records]
+    assert [(major, minor, micro) for major, minor, micro in zip(columns.major, columns.minor, columns.micro)] == \
+            [record.version_info for record in records]
@@ -0,0 +1,50 @@
+"""Release page enrichment and the release links kept by the index and its exports."""
+import pytest
+
+from py_version_tracker import PyFile, PyVersionTracker, ReleaseIndex, export_index, import_index
+
+
+def test_release_links_are_followed(tracker):
+    index = tracker()._release_index()
+    assert len(index.links) == len(index.by_version)
+    assert tracker._release_url('3.12.0', index).endswith('/downloads/release/python-3120/')
+
+    moved = ReleaseIndex(index.releases, index.active, index.featured, {'3.12.0': '/release/3.12.0/'})
+    assert tracker._release_url('3.12.0', moved) == tracker._MAIN_PG.rsplit('/', 1)[0] + '/release/3.12.0/'
+    # Versions without a captured link fall back to the usual release page path.
+    assert tracker._release_url('3.11.6', moved).endswith('/downloads/release/python-3116/')
+
+
+def test_enrich_versions_reads_the_files_table(tracker):
+    [release] = tracker.enrich_versions(['3.12.0'])
+    assert release.error is None
+    assert release.schedule == 'PEP 693'
+    source, windows = release.files
+    assert source == PyFile(name='Gzipped source tarball',
+                            url='https://www.python.org/ftp/python/3.12.0/Python-3.12.0.tgz',
+                            operating_system='Source release', description=None,
+                            md5='f6f4616584b23254d165f4db90c247d6', size=27195214,
+                            signature='https://www.python.org/ftp/python/3.12.0/Python-3.12.0.tgz.asc',
+                            sigstore=('https://www.python.org/ftp/python/3.12.0/Python-3.12.0.tgz.crt',
+                                    'https://www.python.org/ftp/python/3.12.0/Python-3.12.0.tgz.sig'))
+    assert (windows.operating_system, windows.description) == ('Windows', 'Recommended')
+
+
+def test_failed_release_pages_do_not_fail_the_batch(tracker, monkeypatch):
+    found, missing = tracker.enrich_versions(['3.12.0', '3.11.6'], retries=2, backoff=0.001)
+    assert found.error is None and len(found.files) == 2
+    assert missing.files == () and '404' in missing.error
+
+    PyVersionTracker._DETAILS.clear()
+    monkeypatch.setattr(PyVersionTracker, '_parse_release_files',
+                        classmethod(lambda cls, html: {}['no files table']))
+    [broken] = tracker(cache_dir=False).enrich_versions(['3.12.0'])
+    assert broken.files == () and 'KeyError' in broken.error
+
+
+@pytest.mark.parametrize('suffix', ['.jsonl', '.csv', '.pvti'])
+def test_exports_keep_release_links(tracker, tmp_path, suffix):
+    index = tracker()._release_index()
+    restored = import_index(export_index(index, tmp_path / f'releases{suffix}'))
+    assert restored == index
+    assert restored.links == index.links
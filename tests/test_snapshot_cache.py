@@ -0,0 +1,83 @@
+"""Persistent release index snapshots: cold fetch, warm start, revalidation and stale-on-error."""
+from _harness import reset_caches, serve_fixture
+from py_version_tracker import PyVersionTracker, SnapshotCache, TrackerStats
+
+
+def _load(__url, cache_dir, cache_ttl):
+    return PyVersionTracker(cache_dir=cache_dir, cache_ttl=cache_ttl)._release_index(__url)
+
+
+def _counted_load(__url, cache_dir, cache_ttl):
+    """Load the index and return it with the counters recorded while loading."""
+    with TrackerStats() as stats:
+        index = _load(__url, cache_dir, cache_ttl)
+    return index, stats.counters
+
+
+def test_cold_fetch_writes_snapshot(fixture_url, tmp_path):
+    index, counters = _counted_load(fixture_url, tmp_path, 3600)
+    assert counters['http.requests'] == 1
+    assert counters['cache.snapshot.miss'] == 1
+    assert index.featured == '3.12.0'
+    entry = SnapshotCache(tmp_path, 3600).load(fixture_url)
+    assert entry is not None and entry.last_modified
+    assert entry.payload == index.to_dict()
+
+
+def test_warm_start_needs_no_network(tmp_path, disable_network):
+    with serve_fixture() as url:
+        cold = _load(url, tmp_path, 3600)
+    connections = disable_network()
+    reset_caches()  # a new process: only the snapshot on disk survives
+
+    warm, counters = _counted_load(url, tmp_path, 3600)
+    assert warm == cold
+    assert counters['cache.snapshot.hit'] == 1
+    assert 'http.requests' not in counters
+    assert connections == []
+
+
+def test_expired_snapshot_is_revalidated_with_304(fixture_url, tmp_path):
+    cold = _load(fixture_url, tmp_path, 0)
+    fetched_at = SnapshotCache(tmp_path, 0).load(fixture_url).fetched_at
+    reset_caches()
+
+    refreshed, counters = _counted_load(fixture_url, tmp_path, 0)
+    assert refreshed == cold
+    assert counters['cache.snapshot.stale'] == 1
+    assert counters['http.requests'] == 1
+    assert counters['http.not_modified'] == 1
+    assert 'parse' not in counters
+    assert SnapshotCache(tmp_path, 0).load(fixture_url).fetched_at > fetched_at
+
+
+def test_fresh_snapshot_is_not_revalidated(fixture_url, tmp_path):
+    _load(fixture_url, tmp_path, 3600)
+    reset_caches()
+
+    _, counters = _counted_load(fixture_url, tmp_path, 3600)
+    assert counters['cache.snapshot.hit'] == 1
+    assert 'cache.snapshot.stale' not in counters
+    assert 'http.requests' not in counters
+
+
+def test_stale_snapshot_is_served_when_the_page_is_unreachable(tmp_path):
+    with serve_fixture() as url:
+        cold = _load(url, tmp_path, 0)
+    reset_caches()
+
+    stale, counters = _counted_load(url, tmp_path, 0)
+    assert stale == cold
+    assert counters['cache.snapshot.stale'] == 1
+    assert counters['http.errors'] >= 1
+
+
+def test_unwritable_cache_directory_falls_back_to_fetching(fixture_url, tmp_path, monkeypatch):
+    blocker = tmp_path / 'not-a-directory'
+    blocker.write_text('')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(blocker))
+
+    index, counters = _counted_load(fixture_url, None, 3600)
+    assert index.featured == '3.12.0'
+    assert counters['cache.snapshot.error'] == 1
+    assert counters['http.requests'] == 1
@@ -0,0 +1,27 @@
+"""Bulk version parsing and comparison: the NumPy and pure-Python paths agree."""
+import pytest
+
+from py_version_tracker.versions import compare_many, satisfies_minimum
+
+np = pytest.importorskip('numpy')
+
+HUGE = 1 << 20
+VERSIONS = ['3.8.1', 'Python 3.12.0', f'3.{HUGE}.0', f'{HUGE}.0', '3.11', 'not a version', None,
+            (3, 10), f'3.8.{HUGE * 4}', '2.7.18']
+
+
+@pytest.mark.parametrize('other', ['3.9.0', f'3.{HUGE}.1', 'garbage', list(reversed(VERSIONS))])
+def test_compare_many_paths_agree(other):
+    python = compare_many(VERSIONS, other, use_numpy=False)
+    assert compare_many(VERSIONS, other, use_numpy=True) == python
+
+
+@pytest.mark.parametrize('minimum', ['3.8', '3.11.0', f'3.{HUGE}'])
+def test_satisfies_minimum_paths_agree(minimum):
+    assert satisfies_minimum(VERSIONS, minimum, use_numpy=True) == \
+            satisfies_minimum(VERSIONS, minimum, use_numpy=False)
+
+
+def test_oversized_components_compare_by_value():
+    assert compare_many([f'3.{HUGE}.0'], '3.9.0', use_numpy=True) == [1]
+    assert satisfies_minimum([f'3.{HUGE}.0', f'3.8.{HUGE}'], '3.9', use_numpy=True) == [True, False]